@@ -8,33 +8,99 @@ Usage:
     python main.py quick-test --provider shumei
 """
 
+import os
 import sys
+import stat
 import logging
+import functools
+import contextlib
+import importlib.util
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from src.config import Config
-from src.providers import get_provider, list_providers, PROVIDERS
-from src.data.loader import DataLoader, create_sample_data
-from src.data.datasets import VendorDataLoader, DATASET_CONFIGS, list_datasets, get_dataset_info
-from src.benchmark.runner import BenchmarkRunner, MultiProviderRunner
-from src.benchmark.reporter import Reporter
+from src.logging_utils import CachedTimeFormatter
+
+if TYPE_CHECKING:
+    from src.benchmark.runner import BenchmarkConfig
+
+# rich, the providers (and their vendor SDKs) and the benchmark modules are
+# imported inside each command so that `--help` and light commands stay fast.
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def log_handler() -> logging.Handler:
+    """Create a stderr handler using the cached-time formatter."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(CachedTimeFormatter(LOG_FORMAT))
+    return handler
+
 
 # Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+logging.basicConfig(level=logging.INFO, handlers=[log_handler()])
 logger = logging.getLogger(__name__)
 
-console = Console()
+
+@functools.lru_cache(maxsize=None)
+def get_console():
+    """Return the shared rich console, importing rich on first use."""
+    from rich.console import Console
+    return Console()
+
+
+def validate_inputs(data: str) -> None:
+    """
+    Validate CLI inputs before any provider is initialized.
+    
+    Exits with an error message if the data file is missing or is not a
+    regular file.
+    """
+    try:
+        st = os.stat(data)
+    except OSError:
+        get_console().print(f"[red]Error: Data file not found: {data}[/red]")
+        sys.exit(1)
+    
+    if not stat.S_ISREG(st.st_mode):
+        get_console().print(f"[red]Error: Data path is not a file: {data}[/red]")
+        sys.exit(1)
+
+
+def require_zstandard(ctx, param, value):
+    """Click callback: reject --compress up front when zstandard is missing."""
+    if value and importlib.util.find_spec("zstandard") is None:
+        raise click.BadParameter("requires zstandard. Install with: pip install zstandard")
+    return value
+
+
+@contextlib.contextmanager
+def benchmark_spinner(console, description: str = "Running benchmark..."):
+    """
+    Show a spinner while a benchmark runs.
+    
+    The spinner is skipped when output is not a terminal (CI, redirected
+    logs), where it would only add redraw work and control characters.
+    """
+    if not console.is_terminal:
+        yield
+        return
+    
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        refresh_per_second=4,
+    ) as progress:
+        task = progress.add_task(description, total=None)
+        yield
+        progress.update(task, completed=True)
 
 
 def setup_logging(verbose: bool = False, debug: bool = False):
@@ -47,17 +113,32 @@ def setup_logging(verbose: bool = False, debug: bool = False):
         level = logging.WARNING
     
     # Configure root logger
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        force=True
-    )
+    logging.basicConfig(level=level, handlers=[log_handler()], force=True)
     
     # Also set level for our modules
     for module in ['src.providers', 'src.benchmark', 'src.data']:
         logging.getLogger(module).setLevel(level)
 
 
+def build_benchmark_config(
+    concurrency=None,
+    cache=False,
+    cache_refresh=False,
+    dedup=False,
+) -> "BenchmarkConfig":
+    """Build runner configuration from the shared CLI options."""
+    from src.config import Config
+    from src.benchmark.runner import BenchmarkConfig
+
+    return BenchmarkConfig(
+        max_workers=concurrency or Config.MAX_WORKERS,
+        request_interval=Config.REQUEST_INTERVAL,
+        use_cache=cache,
+        refresh_cache=cache_refresh,
+        dedup=dedup,
+    )
+
+
 @click.group()
 @click.version_option(version="1.0.0")
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose output (INFO level)')
@@ -86,13 +167,25 @@ def cli(ctx, verbose, debug):
 @click.option('--image/--no-image', default=True, help='Run image moderation tests')
 @click.option('--output', '-o', default=None, help='Output report filename')
 @click.option('--format', '-f', type=click.Choice(['md', 'json', 'both']), default='both', help='Output format')
-def run(provider, data, limit, text, image, output, format):
+@click.option('--concurrency', '-c', default=None, type=click.IntRange(min=1), help='Concurrent requests in flight (default: MAX_WORKERS)')
+@click.option('--cache/--no-cache', default=False, help='Reuse cached API responses from previous runs')
+@click.option('--cache-refresh', is_flag=True, help='Ignore cached responses but store fresh ones')
+@click.option('--dedup', is_flag=True, help='Send identical inputs to the provider only once')
+@click.option('--compress', is_flag=True, callback=require_zstandard, help='Write JSON results zstd-compressed (.json.zst)')
+def run(provider, data, limit, text, image, output, format, concurrency, cache, cache_refresh, dedup, compress):
     """
     Run benchmark for a single provider.
     
     Example:
         python main.py run -p shumei -d test_data.xlsx -l 100
     """
+    from src.config import Config
+    from src.providers import get_provider, list_providers
+    from src.benchmark.runner import BenchmarkRunner
+    from src.benchmark.reporter import Reporter
+
+    console = get_console()
+
     console.print(f"\n[bold blue]Content Moderation Benchmark[/bold blue]")
     console.print(f"Provider: [cyan]{provider}[/cyan]")
     console.print(f"Data: [cyan]{data}[/cyan]")
@@ -100,6 +193,9 @@ def run(provider, data, limit, text, image, output, format):
         console.print(f"Limit: [cyan]{limit}[/cyan]")
     console.print("")
     
+    # Verify data file before initializing the provider
+    validate_inputs(data)
+    
     # Get provider
     try:
         provider_instance = get_provider(provider)
@@ -113,29 +209,20 @@ def run(provider, data, limit, text, image, output, format):
         console.print("Make sure your .env file is configured correctly.")
         sys.exit(1)
     
-    # Verify data file
-    if not Path(data).exists():
-        console.print(f"[red]Error: Data file not found: {data}[/red]")
-        sys.exit(1)
-    
     # Run benchmark
-    runner = BenchmarkRunner(provider_instance)
+    runner = BenchmarkRunner(provider_instance, build_benchmark_config(concurrency, cache, cache_refresh, dedup))
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Running benchmark...", total=None)
-        
+    with benchmark_spinner(console):
         result = runner.run(
             data_file=data,
             limit=limit,
             test_text=text,
             test_image=image,
         )
-        
-        progress.update(task, completed=True)
+    
+    if not result.text_metrics and not result.image_metrics:
+        console.print("[yellow]⚠️  No text or image tests were run; no report generated.[/yellow]")
+        return
     
     # Generate reports
     Config.ensure_directories()
@@ -146,7 +233,7 @@ def run(provider, data, limit, text, image, output, format):
         console.print(f"📄 Markdown report: [green]{md_path}[/green]")
     
     if format in ['json', 'both']:
-        json_path = reporter.generate_json(result)
+        json_path = reporter.generate_json(result, compress=compress)
         console.print(f"📊 JSON results: [green]{json_path}[/green]")
     
     # Print summary
@@ -159,13 +246,25 @@ def run(provider, data, limit, text, image, output, format):
 @click.option('--limit', '-l', default=None, type=int, help='Limit number of test cases')
 @click.option('--text/--no-text', default=True, help='Run text moderation tests')
 @click.option('--image/--no-image', default=True, help='Run image moderation tests')
-def compare(providers, data, limit, text, image):
+@click.option('--concurrency', '-c', default=None, type=click.IntRange(min=1), help='Concurrent requests in flight per provider (default: MAX_WORKERS)')
+@click.option('--cache/--no-cache', default=False, help='Reuse cached API responses from previous runs')
+@click.option('--cache-refresh', is_flag=True, help='Ignore cached responses but store fresh ones')
+@click.option('--dedup', is_flag=True, help='Send identical inputs to the provider only once')
+@click.option('--parallel', is_flag=True, help='Benchmark all providers at the same time instead of one after another')
+def compare(providers, data, limit, text, image, concurrency, cache, cache_refresh, dedup, parallel):
     """
     Compare multiple providers.
     
     Example:
         python main.py compare -p shumei,yidun -d test_data.xlsx -l 500
     """
+    from src.config import Config
+    from src.providers import get_provider
+    from src.benchmark.runner import MultiProviderRunner
+    from src.benchmark.reporter import Reporter
+
+    console = get_console()
+
     provider_names = [p.strip() for p in providers.split(',')]
     
     console.print(f"\n[bold blue]Content Moderation Provider Comparison[/bold blue]")
@@ -173,8 +272,11 @@ def compare(providers, data, limit, text, image):
     console.print(f"Data: [cyan]{data}[/cyan]")
     console.print("")
     
+    # Verify data file before initializing any provider
+    validate_inputs(data)
+    
     # Initialize providers
-    multi_runner = MultiProviderRunner()
+    multi_runner = MultiProviderRunner(build_benchmark_config(concurrency, cache, cache_refresh, dedup))
     
     for name in provider_names:
         try:
@@ -196,8 +298,13 @@ def compare(providers, data, limit, text, image):
         limit=limit,
         test_text=text,
         test_image=image,
+        parallel=parallel,
     )
     
+    if not any(r.text_metrics or r.image_metrics for r in results.values()):
+        console.print("[yellow]⚠️  No text or image tests were run; no report generated.[/yellow]")
+        return
+    
     # Generate comparison report
     Config.ensure_directories()
     reporter = Reporter()
@@ -211,37 +318,21 @@ def compare(providers, data, limit, text, image):
 
 def _print_comparison_table(results):
     """Print comparison results as a table."""
+    from rich.table import Table
+
+    console = get_console()
+
     console.print("\n[bold]Comparison Summary[/bold]\n")
     
-    # Text comparison table
-    text_results = {k: v.text_metrics for k, v in results.items() if v.text_metrics}
-    if text_results:
-        table = Table(title="Text Moderation Comparison")
-        table.add_column("Provider", style="cyan")
-        table.add_column("Avg Response", justify="right")
-        table.add_column("P99 Response", justify="right")
-        table.add_column("Success Rate", justify="right")
-        table.add_column("Accuracy", justify="right")
-        table.add_column("Recall", justify="right")
-        table.add_column("F1 Score", justify="right")
-        
-        for name, metrics in text_results.items():
-            table.add_row(
-                name,
-                f"{metrics.avg_response_time*1000:.0f}ms",
-                f"{metrics.p99_response_time*1000:.0f}ms",
-                f"{metrics.success_rate:.1f}%",
-                f"{metrics.accuracy:.1f}%",
-                f"{metrics.recall:.1f}%",
-                f"{metrics.f1_score:.1f}",
-            )
+    for title, attr in (
+        ("Text Moderation Comparison", "text_metrics"),
+        ("Image Moderation Comparison", "image_metrics"),
+    ):
+        type_results = {k: getattr(v, attr) for k, v in results.items() if getattr(v, attr)}
+        if not type_results:
+            continue
         
-        console.print(table)
-    
-    # Image comparison table
-    image_results = {k: v.image_metrics for k, v in results.items() if v.image_metrics}
-    if image_results:
-        table = Table(title="Image Moderation Comparison")
+        table = Table(title=title)
         table.add_column("Provider", style="cyan")
         table.add_column("Avg Response", justify="right")
         table.add_column("P99 Response", justify="right")
@@ -250,7 +341,7 @@ def _print_comparison_table(results):
         table.add_column("Recall", justify="right")
         table.add_column("F1 Score", justify="right")
         
-        for name, metrics in image_results.items():
+        for name, metrics in type_results.items():
             table.add_row(
                 name,
                 f"{metrics.avg_response_time*1000:.0f}ms",
@@ -274,6 +365,11 @@ def quick_test(provider, samples):
     Example:
         python main.py quick-test -p shumei -n 5
     """
+    from src.providers import get_provider
+    from src.benchmark.runner import BenchmarkRunner
+
+    console = get_console()
+
     console.print(f"\n[bold blue]Quick Connectivity Test[/bold blue]")
     console.print(f"Provider: [cyan]{provider}[/cyan]")
     console.print(f"Samples: [cyan]{samples}[/cyan]")
@@ -305,6 +401,11 @@ def quick_test(provider, samples):
 @cli.command('list-providers')
 def list_providers_cmd():
     """List available providers."""
+    from rich.table import Table
+    from src.providers import PROVIDERS
+
+    console = get_console()
+
     console.print("\n[bold]Available Providers:[/bold]\n")
     
     table = Table()
@@ -313,11 +414,10 @@ def list_providers_cmd():
     table.add_column("Status")
     
     for name, provider_class in PROVIDERS.items():
-        try:
-            provider = provider_class()
+        if provider_class.is_configured():
             status = "[green]✅ Configured[/green]"
-        except Exception as e:
-            status = f"[red]❌ Not configured[/red]"
+        else:
+            status = "[red]❌ Not configured[/red]"
         
         table.add_row(name, provider_class.display_name, status)
     
@@ -330,6 +430,10 @@ def list_providers_cmd():
 @click.option('--format', '-f', type=click.Choice(['json', 'csv']), default='json', help='Output format')
 def create_sample(output, format):
     """Create sample test data file."""
+    from src.data.loader import create_sample_data
+
+    console = get_console()
+
     create_sample_data(output, format)
     console.print(f"[green]✅ Sample data created: {output}[/green]")
     console.print("\nEdit this file to add your test cases.")
@@ -338,6 +442,11 @@ def create_sample(output, format):
 @cli.command('list-datasets')
 def list_datasets_cmd():
     """List available vendor datasets."""
+    from rich.table import Table
+    from src.data.datasets import DATASET_CONFIGS
+
+    console = get_console()
+
     console.print("\n[bold]Available Vendor Datasets:[/bold]\n")
     
     table = Table()
@@ -369,7 +478,12 @@ def list_datasets_cmd():
 @click.option('--text/--no-text', default=True, help='Run text moderation tests')
 @click.option('--image/--no-image', default=True, help='Run image moderation tests')
 @click.option('--output', '-o', default=None, help='Output report filename')
-def run_dataset(provider, dataset, limit, text, image, output):
+@click.option('--concurrency', '-c', default=None, type=click.IntRange(min=1), help='Concurrent requests in flight (default: MAX_WORKERS)')
+@click.option('--cache/--no-cache', default=False, help='Reuse cached API responses from previous runs')
+@click.option('--cache-refresh', is_flag=True, help='Ignore cached responses but store fresh ones')
+@click.option('--dedup', is_flag=True, help='Send identical inputs to the provider only once')
+@click.option('--compress', is_flag=True, callback=require_zstandard, help='Write JSON results zstd-compressed (.json.zst)')
+def run_dataset(provider, dataset, limit, text, image, output, concurrency, cache, cache_refresh, dedup, compress):
     """
     Run benchmark using a vendor's dataset.
     
@@ -386,6 +500,14 @@ def run_dataset(provider, dataset, limit, text, image, output):
         # Test all providers with the same dataset
         python main.py run-dataset -p shumei -s yidun -l 500
     """
+    from src.config import Config
+    from src.providers import get_provider, list_providers
+    from src.data.datasets import VendorDataLoader, DATASET_CONFIGS
+    from src.benchmark.runner import BenchmarkRunner
+    from src.benchmark.reporter import Reporter
+
+    console = get_console()
+
     console.print(f"\n[bold blue]Content Moderation Benchmark (Dataset Mode)[/bold blue]")
     console.print(f"Provider: [cyan]{provider}[/cyan]")
     console.print(f"Dataset: [cyan]{dataset}[/cyan]")
@@ -440,23 +562,15 @@ def run_dataset(provider, dataset, limit, text, image, output):
         sys.exit(1)
     
     # Run benchmark
-    runner = BenchmarkRunner(provider_instance)
+    runner = BenchmarkRunner(provider_instance, build_benchmark_config(concurrency, cache, cache_refresh, dedup))
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Running benchmark...", total=None)
-        
+    with benchmark_spinner(console):
         result = runner.run(
             text_cases=text_cases if text else None,
             image_cases=image_cases if image else None,
             test_text=text and bool(text_cases),
             test_image=image and bool(image_cases),
         )
-        
-        progress.update(task, completed=True)
     
     # Generate reports
     Config.ensure_directories()
@@ -470,7 +584,7 @@ def run_dataset(provider, dataset, limit, text, image, output):
     md_path = reporter.generate_markdown(result, output)
     console.print(f"📄 Markdown report: [green]{md_path}[/green]")
     
-    json_path = reporter.generate_json(result)
+    json_path = reporter.generate_json(result, compress=compress)
     console.print(f"📊 JSON results: [green]{json_path}[/green]")
     
     # Print summary
@@ -480,6 +594,10 @@ def run_dataset(provider, dataset, limit, text, image, output):
 @cli.command('init')
 def init():
     """Initialize a new benchmark project."""
+    from src.config import Config
+
+    console = get_console()
+
     console.print("\n[bold blue]Initializing Benchmark Project[/bold blue]\n")
     
     # Create directories
@@ -496,6 +614,22 @@ def init():
     else:
         console.print("✅ .env file exists")
     
+    # Import the benchmark modules and instantiate every configured provider
+    # once, so their bytecode (and the vendor SDKs') is compiled and cached
+    # before the first run, and credential problems show up here
+    import src.benchmark.runner  # noqa: F401
+    import src.benchmark.reporter  # noqa: F401
+    from src.providers import PROVIDERS
+    
+    for name, provider_class in PROVIDERS.items():
+        if not provider_class.is_configured():
+            continue
+        try:
+            provider_class().warmup()
+            console.print(f"✅ Prewarmed provider: {name}")
+        except Exception as e:
+            console.print(f"[yellow]⚠️  Could not prewarm {name}: {e}[/yellow]")
+    
     console.print("\n[bold]Next steps:[/bold]")
     console.print("1. Configure your API credentials in .env")
     console.print("2. Prepare your test data (Excel/JSON/CSV)")
@@ -13,8 +13,12 @@
 
 import sys
 import time
-import json
+import signal
+import threading
 import logging
+import logging.handlers
+import math
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
@@ -27,22 +31,100 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.config import Config
 from src.providers import get_provider
 from src.data.loader import DataLoader
-from src.benchmark.runner import BenchmarkRunner
+from src.benchmark.runner import BenchmarkRunner, BenchmarkConfig
 from src.benchmark.reporter import Reporter
 from src.benchmark.metrics import BenchmarkMetrics
+from src.benchmark.utils import dump_json
+from src.logging_utils import CachedTimeFormatter
 
 # Setup logging
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# 日志格式不含线程/进程信息，跳过每条记录的采集
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+_log_formatter = CachedTimeFormatter(LOG_FORMAT)
+
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+
+# 日志文件经内存缓冲批量写入：满512条、出现ERROR或每轮结束时才落盘
+_file_handler = logging.FileHandler('scheduled_benchmark.log', encoding='utf-8')
+_file_handler.setFormatter(_log_formatter)
+log_file_handler = logging.handlers.MemoryHandler(
+    capacity=512,
+    flushLevel=logging.ERROR,
+    target=_file_handler,
+)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('scheduled_benchmark.log', encoding='utf-8')
+        _stream_handler,
+        log_file_handler,
     ]
 )
 logger = logging.getLogger(__name__)
 
 
+# 汇总键 -> 每轮指标字典中的键
+AGGREGATE_FIELDS = {
+    "avg_response_time": "avg_response_time_ms",
+    "success_rate": "success_rate",
+    "accuracy": "accuracy",
+    "recall": "recall",
+    "precision": "precision",
+    "f1_score": "f1_score",
+}
+
+
+# 汇总表行: (标签, 汇总键, 数值格式, 标准差格式)
+SUMMARY_ROWS = [
+    ("响应时间(ms)", "avg_response_time", ".0f", ".0f"),
+    ("成功率(%)", "success_rate", ".1f", ".2f"),
+    ("准确率(%)", "accuracy", ".1f", ".2f"),
+    ("召回率(%)", "recall", ".1f", ".2f"),
+]
+
+
+# 各轮次详情行模板（format_map 传入单轮结果）；缺少某类指标时逐格格式化
+ROUND_ROW = (
+    "| {round} | {timestamp:.19} "
+    "| {text_metrics[avg_response_time_ms]:.0f} | {image_metrics[avg_response_time_ms]:.0f} "
+    "| {text_metrics[accuracy]:.1f}% | {image_metrics[accuracy]:.1f}% |"
+)
+ROUND_ERROR_ROW = "| {round} | {timestamp:.19} | 错误 | 错误 | - | - |"
+
+
+@dataclass
+class RunningStats:
+    """单个指标的滚动统计（Welford 在线均值/方差），每轮 O(1) 更新"""
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+    
+    def add(self, value: float) -> None:
+        """加入一轮的取值"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+    
+    def summary(self) -> Dict[str, float]:
+        """返回均值、最值和样本标准差"""
+        return {
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "std": math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0,
+        }
+
+
 class ScheduledBenchmark:
     """定时压测执行器"""
     
@@ -54,6 +136,7 @@ class ScheduledBenchmark:
         image_limit: int = 500,
         duration_hours: int = 24,
         interval_hours: int = 2,
+        parallel_types: bool = False,
     ):
         """
         初始化定时压测
@@ -65,6 +148,7 @@ class ScheduledBenchmark:
             image_limit: 每轮图片测试数量
             duration_hours: 总测试时长（小时）
             interval_hours: 测试间隔（小时）
+            parallel_types: 每轮文本与图片测试同时进行
         """
         self.provider_name = provider_name
         self.data_file = data_file
@@ -72,12 +156,15 @@ class ScheduledBenchmark:
         self.image_limit = image_limit
         self.duration_hours = duration_hours
         self.interval_hours = interval_hours
+        self.parallel_types = parallel_types
         
         # 初始化供应商
         self.provider = get_provider(provider_name)
         
-        # 初始化数据加载器
-        self.loader = DataLoader(data_file)
+        # 加载测试数据（数据文件在压测期间不变，只解析一次，各轮复用）
+        with DataLoader(data_file) as loader:
+            self.text_cases = loader.load_text_cases(limit=text_limit)
+            self.image_cases = loader.load_image_cases(limit=image_limit)
         
         # 确保输出目录存在
         Config.ensure_directories()
@@ -85,6 +172,20 @@ class ScheduledBenchmark:
         # 存储所有轮次结果
         self.round_results: List[Dict[str, Any]] = []
         
+        # 各指标的滚动汇总，每轮完成时更新
+        self._aggregates: Dict[str, Dict[str, RunningStats]] = {
+            metric_type: {key: RunningStats() for key in AGGREGATE_FIELDS}
+            for metric_type in ("text_metrics", "image_metrics")
+        }
+        
+        # 中间结果按行追加写入（JSON Lines），每轮只序列化本轮记录
+        self.progress_file = Config.REPORT_DIR / "scheduled_benchmark_progress.jsonl"
+        self._progress_fh = None
+        
+        # 置位后轮次循环在当前轮结束时退出
+        self._stop = threading.Event()
+        self._previous_sigint = None
+        
         # 计算总轮次
         self.total_rounds = duration_hours // interval_hours
         
@@ -107,11 +208,52 @@ class ScheduledBenchmark:
         logger.info(f"预计结束: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info(f"="*60)
         
-        round_num = 0
+        self._open_progress(start_time)
+        
+        # 第一次 Ctrl+C 只请求停止：当前轮次跑完后退出等待，仍生成汇总报告；
+        # 处理函数随即恢复原来的 SIGINT 处理，第二次 Ctrl+C 立即中止
+        self._previous_sigint = None
+        if threading.current_thread() is threading.main_thread():
+            self._previous_sigint = signal.signal(signal.SIGINT, self._request_stop)
+        
+        try:
+            self._run_rounds()
+        finally:
+            if self._previous_sigint is not None:
+                signal.signal(signal.SIGINT, self._previous_sigint)
+                self._previous_sigint = None
+            self._progress_fh.close()
+            self._progress_fh = None
+        
+        # 生成汇总报告
+        self._generate_summary_report()
         
-        while datetime.now() < end_time:
-            round_num += 1
+        logger.info(f"\n{'='*60}")
+        logger.info(f"定时压测完成")
+        logger.info(f"实际轮次: {len(self.round_results)}")
+        logger.info(f"总耗时: {datetime.now() - start_time}")
+        logger.info(f"{'='*60}")
+        log_file_handler.flush()
+    
+    def _request_stop(self, signum, frame) -> None:
+        """SIGINT 处理：通知轮次循环尽快结束，并让下一次 SIGINT 直接中止"""
+        logger.warning("收到中断信号，本轮结束后停止测试（再次按 Ctrl+C 立即中止）")
+        self._stop.set()
+        if self._previous_sigint is not None:
+            signal.signal(signal.SIGINT, self._previous_sigint)
+            self._previous_sigint = None
+    
+    def _run_rounds(self) -> None:
+        """按固定节拍执行各轮测试，直到结束时间或收到停止信号"""
+        # 各轮计划开始时间都按起点的单调时钟计算，避免逐轮累积漂移
+        interval = self.interval_hours * 3600
+        start_mono = time.monotonic()
+        end_mono = start_mono + self.duration_hours * 3600
+        round_num = 1
+        
+        while not self._stop.is_set() and time.monotonic() < end_mono:
             round_start = datetime.now()
+            drift = time.monotonic() - (start_mono + (round_num - 1) * interval)
             
             logger.info(f"\n{'='*60}")
             logger.info(f"第 {round_num}/{self.total_rounds} 轮测试开始")
@@ -121,56 +263,70 @@ class ScheduledBenchmark:
             try:
                 # 执行单轮测试
                 round_result = self._run_single_round(round_num)
-                self.round_results.append(round_result)
-                
-                # 保存中间结果
-                self._save_intermediate_results()
-                
                 logger.info(f"第 {round_num} 轮完成")
                 
             except Exception as e:
                 logger.error(f"第 {round_num} 轮测试出错: {e}")
-                self.round_results.append({
+                round_result = {
                     "round": round_num,
                     "timestamp": round_start.isoformat(),
                     "error": str(e),
-                })
+                }
+            
+            # 记录相对计划开始时间的偏差，便于事后分析
+            round_result["start_drift_sec"] = round(drift, 3)
+            
+            self.round_results.append(round_result)
+            self._update_aggregates(round_result)
+            
+            # 保存中间结果
+            self._save_intermediate_results(round_result)
+            
+            # 本轮耗时超过间隔时跳过已错过的节拍，从当前时间之后的第一个节拍继续，
+            # 而不是立即连续补跑
+            next_round = max(
+                round_num + 1,
+                math.ceil((time.monotonic() - start_mono) / interval) + 1,
+            )
+            if next_round > round_num + 1:
+                logger.warning(
+                    f"第 {round_num} 轮耗时超过测试间隔，跳过 {next_round - round_num - 1} 个已错过的节拍"
+                )
+            round_num = next_round
             
             # 检查是否还需要继续
-            next_round_time = round_start + timedelta(hours=self.interval_hours)
+            next_round_mono = start_mono + (round_num - 1) * interval
             
-            if next_round_time >= end_time:
+            if next_round_mono >= end_mono:
                 logger.info("已达到预定结束时间，停止测试")
                 break
             
-            # 等待到下一轮
-            wait_seconds = (next_round_time - datetime.now()).total_seconds()
+            # 等待到下一轮（可被停止信号打断）
+            wait_seconds = next_round_mono - time.monotonic()
             if wait_seconds > 0:
+                next_round_time = datetime.now() + timedelta(seconds=wait_seconds)
                 logger.info(f"等待 {wait_seconds/3600:.1f} 小时后开始下一轮...")
                 logger.info(f"下一轮预计时间: {next_round_time.strftime('%Y-%m-%d %H:%M:%S')}")
-                time.sleep(wait_seconds)
-        
-        # 生成汇总报告
-        self._generate_summary_report()
-        
-        logger.info(f"\n{'='*60}")
-        logger.info(f"定时压测完成")
-        logger.info(f"实际轮次: {len(self.round_results)}")
-        logger.info(f"总耗时: {datetime.now() - start_time}")
-        logger.info(f"{'='*60}")
+                log_file_handler.flush()
+                if self._stop.wait(wait_seconds):
+                    logger.info("收到停止信号，停止测试")
+                    break
     
     def _run_single_round(self, round_num: int) -> Dict[str, Any]:
         """执行单轮测试"""
         timestamp = datetime.now()
         
-        # 加载测试数据
-        text_cases = self.loader.load_text_cases(limit=self.text_limit)
-        image_cases = self.loader.load_image_cases(limit=self.image_limit)
+        text_cases = self.text_cases
+        image_cases = self.image_cases
         
-        logger.info(f"加载测试数据: 文本 {len(text_cases)} 条, 图片 {len(image_cases)} 条")
+        logger.info(f"测试数据: 文本 {len(text_cases)} 条, 图片 {len(image_cases)} 条")
         
         # 执行测试
-        runner = BenchmarkRunner(self.provider)
+        runner = BenchmarkRunner(self.provider, BenchmarkConfig(
+            max_workers=Config.MAX_WORKERS,
+            request_interval=Config.REQUEST_INTERVAL,
+            parallel_types=self.parallel_types,
+        ))
         result = runner.run(
             text_cases=text_cases,
             image_cases=image_cases,
@@ -196,11 +352,10 @@ class ScheduledBenchmark:
         
         return round_result
     
-    def _save_intermediate_results(self) -> None:
-        """保存中间结果（防止意外中断丢失数据）"""
-        output_file = Config.REPORT_DIR / "scheduled_benchmark_progress.json"
-        
-        data = {
+    def _open_progress(self, start_time: datetime) -> None:
+        """创建中间结果文件，首行写入本次压测的配置"""
+        self._progress_fh = open(self.progress_file, "wb", buffering=1 << 16)
+        self._write_progress({
             "provider": self.provider_name,
             "config": {
                 "text_limit": self.text_limit,
@@ -208,16 +363,25 @@ class ScheduledBenchmark:
                 "duration_hours": self.duration_hours,
                 "interval_hours": self.interval_hours,
             },
-            "completed_rounds": len(self.round_results),
             "total_rounds": self.total_rounds,
-            "rounds": self.round_results,
+            "started_at": start_time.isoformat(),
+        })
+    
+    def _write_progress(self, record: Dict[str, Any]) -> None:
+        """追加一行JSON并立即落盘"""
+        self._progress_fh.write(dump_json(record, indent=False) + b"\n")
+        self._progress_fh.flush()
+    
+    def _save_intermediate_results(self, round_result: Dict[str, Any]) -> None:
+        """保存中间结果（防止意外中断丢失数据）"""
+        # 只追加本轮记录，不再重写之前所有轮次
+        self._write_progress({
+            **round_result,
+            "completed_rounds": len(self.round_results),
             "updated_at": datetime.now().isoformat(),
-        }
+        })
         
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        
-        logger.info(f"中间结果已保存: {output_file}")
+        logger.info(f"中间结果已保存: {self.progress_file}")
     
     def _generate_summary_report(self) -> None:
         """生成汇总报告"""
@@ -240,26 +404,18 @@ class ScheduledBenchmark:
         lines.append(f"- 完成轮次: {len(self.round_results)}/{self.total_rounds}")
         lines.append("\n---\n")
         
-        # 文本审核汇总
-        if text_stats:
-            lines.append("## 文本审核汇总\n")
-            lines.append("| 指标 | 平均值 | 最小值 | 最大值 | 标准差 |")
-            lines.append("|------|--------|--------|--------|--------|")
-            lines.append(f"| 响应时间(ms) | {text_stats['avg_response_time']['mean']:.0f} | {text_stats['avg_response_time']['min']:.0f} | {text_stats['avg_response_time']['max']:.0f} | {text_stats['avg_response_time']['std']:.0f} |")
-            lines.append(f"| 成功率(%) | {text_stats['success_rate']['mean']:.1f} | {text_stats['success_rate']['min']:.1f} | {text_stats['success_rate']['max']:.1f} | {text_stats['success_rate']['std']:.2f} |")
-            lines.append(f"| 准确率(%) | {text_stats['accuracy']['mean']:.1f} | {text_stats['accuracy']['min']:.1f} | {text_stats['accuracy']['max']:.1f} | {text_stats['accuracy']['std']:.2f} |")
-            lines.append(f"| 召回率(%) | {text_stats['recall']['mean']:.1f} | {text_stats['recall']['min']:.1f} | {text_stats['recall']['max']:.1f} | {text_stats['recall']['std']:.2f} |")
-            lines.append("")
-        
-        # 图片审核汇总
-        if image_stats:
-            lines.append("## 图片审核汇总\n")
+        # 文本/图片审核汇总
+        for title, stats in (("文本审核汇总", text_stats), ("图片审核汇总", image_stats)):
+            if not stats:
+                continue
+            lines.append(f"## {title}\n")
             lines.append("| 指标 | 平均值 | 最小值 | 最大值 | 标准差 |")
             lines.append("|------|--------|--------|--------|--------|")
-            lines.append(f"| 响应时间(ms) | {image_stats['avg_response_time']['mean']:.0f} | {image_stats['avg_response_time']['min']:.0f} | {image_stats['avg_response_time']['max']:.0f} | {image_stats['avg_response_time']['std']:.0f} |")
-            lines.append(f"| 成功率(%) | {image_stats['success_rate']['mean']:.1f} | {image_stats['success_rate']['min']:.1f} | {image_stats['success_rate']['max']:.1f} | {image_stats['success_rate']['std']:.2f} |")
-            lines.append(f"| 准确率(%) | {image_stats['accuracy']['mean']:.1f} | {image_stats['accuracy']['min']:.1f} | {image_stats['accuracy']['max']:.1f} | {image_stats['accuracy']['std']:.2f} |")
-            lines.append(f"| 召回率(%) | {image_stats['recall']['mean']:.1f} | {image_stats['recall']['min']:.1f} | {image_stats['recall']['max']:.1f} | {image_stats['recall']['std']:.2f} |")
+            for label, key, spec, std_spec in SUMMARY_ROWS:
+                row = stats[key]
+                lines.append(
+                    f"| {label} | {row['mean']:{spec}} | {row['min']:{spec}} | {row['max']:{spec}} | {row['std']:{std_spec}} |"
+                )
             lines.append("")
         
         # 各轮次详情
@@ -269,19 +425,21 @@ class ScheduledBenchmark:
         
         for r in self.round_results:
             if "error" in r:
-                lines.append(f"| {r['round']} | {r['timestamp'][:19]} | 错误 | 错误 | - | - |")
-            else:
-                text_resp = r.get("text_metrics", {}).get("avg_response_time_ms", "-") if r.get("text_metrics") else "-"
-                img_resp = r.get("image_metrics", {}).get("avg_response_time_ms", "-") if r.get("image_metrics") else "-"
-                text_acc = r.get("text_metrics", {}).get("accuracy", "-") if r.get("text_metrics") else "-"
-                img_acc = r.get("image_metrics", {}).get("accuracy", "-") if r.get("image_metrics") else "-"
-                
-                text_resp_str = f"{text_resp:.0f}" if isinstance(text_resp, (int, float)) else text_resp
-                img_resp_str = f"{img_resp:.0f}" if isinstance(img_resp, (int, float)) else img_resp
-                text_acc_str = f"{text_acc:.1f}%" if isinstance(text_acc, (int, float)) else text_acc
-                img_acc_str = f"{img_acc:.1f}%" if isinstance(img_acc, (int, float)) else img_acc
-                
-                lines.append(f"| {r['round']} | {r['timestamp'][:19]} | {text_resp_str} | {img_resp_str} | {text_acc_str} | {img_acc_str} |")
+                lines.append(ROUND_ERROR_ROW.format_map(r))
+                continue
+            
+            try:
+                # 文本、图片指标齐全时一次套用模板
+                lines.append(ROUND_ROW.format_map(r))
+            except (KeyError, TypeError, ValueError):
+                text, image = r.get("text_metrics"), r.get("image_metrics")
+                cells = " | ".join([
+                    self._round_cell(text, "avg_response_time_ms", "{:.0f}"),
+                    self._round_cell(image, "avg_response_time_ms", "{:.0f}"),
+                    self._round_cell(text, "accuracy", "{:.1f}%"),
+                    self._round_cell(image, "accuracy", "{:.1f}%"),
+                ])
+                lines.append(f"| {r['round']} | {r['timestamp'][:19]} | {cells} |")
         
         # 保存报告
         report_file = Config.REPORT_DIR / f"scheduled_benchmark_summary_{timestamp}.md"
@@ -292,8 +450,8 @@ class ScheduledBenchmark:
         
         # 保存JSON结果
         json_file = Config.REPORT_DIR / f"scheduled_benchmark_results_{timestamp}.json"
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump({
+        with open(json_file, "wb") as f:
+            f.write(dump_json({
                 "provider": self.provider_name,
                 "config": {
                     "text_limit": self.text_limit,
@@ -306,47 +464,31 @@ class ScheduledBenchmark:
                     "image": image_stats,
                 },
                 "rounds": self.round_results,
-            }, f, ensure_ascii=False, indent=2)
+            }))
         
         logger.info(f"JSON结果已保存: {json_file}")
     
+    @staticmethod
+    def _round_cell(metrics: Optional[Dict[str, Any]], key: str, template: str) -> str:
+        """格式化轮次详情表中的一个单元格，缺失时显示 '-'"""
+        value = metrics.get(key, "-") if metrics else "-"
+        return template.format(value) if isinstance(value, (int, float)) else value
+    
+    def _update_aggregates(self, round_result: Dict[str, Any]) -> None:
+        """将一轮的指标计入滚动汇总"""
+        for metric_type, stats in self._aggregates.items():
+            metrics = round_result.get(metric_type)
+            if metrics:
+                for key, source in AGGREGATE_FIELDS.items():
+                    stats[key].add(metrics.get(source, 0))
+    
     def _aggregate_metrics(self, metric_type: str) -> Optional[Dict[str, Any]]:
         """聚合多轮指标"""
-        import statistics
-        
-        values = {
-            "avg_response_time": [],
-            "success_rate": [],
-            "accuracy": [],
-            "recall": [],
-            "precision": [],
-            "f1_score": [],
-        }
-        
-        for r in self.round_results:
-            metrics = r.get(metric_type)
-            if metrics:
-                values["avg_response_time"].append(metrics.get("avg_response_time_ms", 0))
-                values["success_rate"].append(metrics.get("success_rate", 0))
-                values["accuracy"].append(metrics.get("accuracy", 0))
-                values["recall"].append(metrics.get("recall", 0))
-                values["precision"].append(metrics.get("precision", 0))
-                values["f1_score"].append(metrics.get("f1_score", 0))
-        
-        if not values["avg_response_time"]:
+        stats = self._aggregates[metric_type]
+        if not stats["avg_response_time"].count:
             return None
         
-        result = {}
-        for key, vals in values.items():
-            if vals:
-                result[key] = {
-                    "mean": statistics.mean(vals),
-                    "min": min(vals),
-                    "max": max(vals),
-                    "std": statistics.stdev(vals) if len(vals) > 1 else 0,
-                }
-        
-        return result
+        return {key: s.summary() for key, s in stats.items()}
 
 
 @click.command()
@@ -356,7 +498,8 @@ class ScheduledBenchmark:
 @click.option('--interval', type=int, default=2, help='测试间隔（小时）')
 @click.option('--text-limit', type=int, default=1000, help='每轮文本测试数量')
 @click.option('--image-limit', type=int, default=500, help='每轮图片测试数量')
-def main(provider, data, duration, interval, text_limit, image_limit):
+@click.option('--parallel-types', is_flag=True, help='文本与图片测试同时进行（总并发翻倍）')
+def main(provider, data, duration, interval, text_limit, image_limit, parallel_types):
     """
     定时压测工具
     
@@ -381,6 +524,8 @@ def main(provider, data, duration, interval, text_limit, image_limit):
     print(f"  每轮文本: {text_limit}条")
     print(f"  每轮图片: {image_limit}条")
     print(f"  预计轮次: {duration // interval}轮")
+    if parallel_types:
+        print(f"  文本/图片: 同时进行")
     print()
     
     confirm = input("确认开始测试？(yes/no): ").strip().lower()
@@ -395,6 +540,7 @@ def main(provider, data, duration, interval, text_limit, image_limit):
         image_limit=image_limit,
         duration_hours=duration,
         interval_hours=interval,
+        parallel_types=parallel_types,
     )
     
     benchmark.run()
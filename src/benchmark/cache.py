@@ -0,0 +1,169 @@
+"""
+On-disk response cache for moderation API calls.
+Lets repeated benchmark runs over the same dataset skip the network.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+from ..providers.base import ModerationResult, ContentType, RiskLevel
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of moderation results.
+
+    Entries are keyed by provider, content type and a hash of the content.
+    Only successful results are stored; the original response time is kept
+    so that cached runs replay the latency measured on the cold call.
+
+    Example:
+        cache = ResponseCache(Config.OUTPUT_DIR / "cache" / "responses.sqlite3")
+        result = cache.get("shumei", ContentType.TEXT, "some text")
+        if result is None:
+            result = provider.moderate_text("some text")
+            cache.put("shumei", ContentType.TEXT, "some text", result)
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize response cache.
+
+        Args:
+            db_path: Path to the SQLite database file (created if missing)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Worker threads share one connection, serialized by the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        # WAL lets concurrent runs (compare --parallel) share the file, and
+        # synchronous=NORMAL skips the fsync on each per-result commit
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " provider TEXT NOT NULL,"
+            " content_type TEXT NOT NULL,"
+            " result TEXT NOT NULL,"
+            " response_time REAL NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(provider: str, content_type: ContentType, content: str) -> str:
+        """
+        Build the cache key for a piece of content.
+
+        For a local image file the key also covers its mtime and size, so
+        replacing or editing the file under the same name is a miss.
+        """
+        key = f"{provider}|{content_type.value}|{content}"
+        if content_type == ContentType.IMAGE and not content.startswith(("http://", "https://")):
+            try:
+                st = os.stat(content)
+            except (OSError, ValueError):
+                pass  # Not a local path (e.g. inline BASE64)
+            else:
+                key += f"|{st.st_mtime_ns}|{st.st_size}"
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16)
+        return digest.hexdigest()
+
+    def get(
+        self,
+        provider: str,
+        content_type: ContentType,
+        content: str,
+    ) -> Optional[ModerationResult]:
+        """
+        Look up a cached result.
+
+        Returns:
+            Cached ModerationResult, or None on a miss (including when the
+            database cannot be read)
+        """
+        key = self.make_key(provider, content_type, content)
+
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT result FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                # A locked or unreadable cache only costs the speedup
+                logger.warning(f"Response cache lookup failed, treating as a miss: {e}")
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        data = json.loads(row[0])
+        return ModerationResult(
+            success=True,
+            risk_level=RiskLevel(data["risk_level"]),
+            risk_label=data["risk_label"],
+            risk_labels=data["risk_labels"],
+            confidence=data["confidence"],
+            response_time=data["response_time"],
+            raw_response=data["raw_response"],
+            provider=provider,
+            content_type=content_type,
+        )
+
+    def put(
+        self,
+        provider: str,
+        content_type: ContentType,
+        content: str,
+        result: ModerationResult,
+    ) -> None:
+        """
+        Store a result. Failed results are never cached.
+
+        Database errors (locked file, full disk) are logged and the result
+        is simply not cached.
+        """
+        if not result.success:
+            return
+
+        key = self.make_key(provider, content_type, content)
+        data = json.dumps({
+            "risk_level": result.risk_level.value,
+            "risk_label": result.risk_label,
+            "risk_labels": result.risk_labels,
+            "confidence": result.confidence,
+            "response_time": result.response_time,
+            "raw_response": result.raw_response,
+        }, ensure_ascii=False, default=str)
+
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, provider, content_type.value, data, result.response_time, time.time()),
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                # The API result is still valid; it just is not cached
+                logger.warning(f"Response cache write failed, skipping: {e}")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -3,12 +3,27 @@ Metrics collection and calculation for benchmarks.
 """
 
 import time
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from collections import defaultdict
 
+import numpy as np
 
-@dataclass
+
+# Label meaning "no risk"
+SAFE_LABEL = "正常"
+
+# Error categories, checked in order against the lower-cased error message
+ERROR_CATEGORIES: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("timeout",), "Timeout"),
+    (("network", "connection"), "Network Error"),
+    (("http",), "HTTP Error"),
+    (("api",), "API Error"),
+)
+
+
+@dataclass(slots=True)
 class BenchmarkMetrics:
     """
     Aggregated benchmark metrics for a single test run.
@@ -26,7 +41,6 @@ class BenchmarkMetrics:
     timeout_count: int = 0
     
     # Performance metrics (in seconds)
-    response_times: List[float] = field(default_factory=list)
     avg_response_time: float = 0.0
     min_response_time: float = 0.0
     max_response_time: float = 0.0
@@ -95,6 +109,40 @@ class BenchmarkMetrics:
         return (self.timeout_count / self.total_requests) * 100
 
 
+@dataclass
+class ResultColumns:
+    """
+    Per-request results stored column-wise (structure of arrays).
+    
+    Numeric fields live in compact typed arrays that NumPy can view without
+    copying, instead of one dict per request.
+    """
+    success: array = field(default_factory=lambda: array("b"))
+    response_time: array = field(default_factory=lambda: array("d"))
+    y_true: array = field(default_factory=lambda: array("b"))  # 1 = expected risky
+    y_pred: array = field(default_factory=lambda: array("b"))  # 1 = flagged risky
+    match: array = field(default_factory=lambda: array("b"))   # 1 = successful and label matched
+    
+    def append(
+        self,
+        success: bool,
+        response_time: float,
+        expected: str,
+        actual: str,
+        match: bool,
+    ) -> int:
+        """Append one request and return its row index."""
+        self.success.append(success)
+        self.response_time.append(response_time)
+        self.y_true.append(expected != SAFE_LABEL)
+        self.y_pred.append(actual != SAFE_LABEL)
+        self.match.append(match)
+        return len(self.success) - 1
+    
+    def __len__(self) -> int:
+        return len(self.success)
+
+
 class MetricsCollector:
     """
     Collects metrics during benchmark execution.
@@ -121,37 +169,30 @@ class MetricsCollector:
         self.content_type = content_type
         
         # Raw data collection
-        self.response_times: List[float] = []
-        self.results: List[Dict[str, Any]] = []
+        self.results = ResultColumns()
         
         # Counters
         self.success_count = 0
         self.fail_count = 0
         self.timeout_count = 0
         
-        # Confusion matrix
-        self.true_positive = 0
-        self.true_negative = 0
-        self.false_positive = 0
-        self.false_negative = 0
-        
         # Error tracking
         self.error_types: Dict[str, int] = defaultdict(int)
         
-        # Per-category tracking
-        self.category_results: Dict[str, List[Dict]] = defaultdict(list)
+        # Per-category tracking (row indices into self.results)
+        self.category_rows: Dict[str, array] = defaultdict(lambda: array("q"))
         
-        # Timing
-        self.start_time: Optional[float] = None
-        self.end_time: Optional[float] = None
+        # Timing (monotonic perf_counter_ns readings, immune to clock slew)
+        self.start_ns: Optional[int] = None
+        self.end_ns: Optional[int] = None
     
     def start(self) -> None:
         """Mark the start of benchmark."""
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
     
     def stop(self) -> None:
         """Mark the end of benchmark."""
-        self.end_time = time.time()
+        self.end_ns = time.perf_counter_ns()
     
     def record(
         self, 
@@ -168,45 +209,29 @@ class MetricsCollector:
             category: Test category (optional)
         """
         # Record basic result
-        record = {
-            "success": result.success,
-            "response_time": result.response_time,
-            "expected": expected_risk,
-            "actual": result.risk_label,
-            "risk_level": result.risk_level.value if hasattr(result.risk_level, 'value') else str(result.risk_level),
-            "error": result.error,
-        }
-        self.results.append(record)
+        row = self.results.append(
+            result.success,
+            result.response_time,
+            expected_risk,
+            result.risk_label,
+            result.success and self._is_match(expected_risk, result.risk_label),
+        )
         
         # Update counters
         if result.success:
             self.success_count += 1
-            self.response_times.append(result.response_time)
         else:
             self.fail_count += 1
-            if result.error and "timeout" in result.error.lower():
-                self.timeout_count += 1
             
-            # Track error types
+            # Track error types (a "Timeout" category also counts as a timeout)
             error_type = self._categorize_error(result.error)
             self.error_types[error_type] += 1
-        
-        # Update confusion matrix
-        is_positive_expected = expected_risk != "正常"
-        is_positive_actual = result.risk_label != "正常"
-        
-        if is_positive_expected and is_positive_actual:
-            self.true_positive += 1
-        elif not is_positive_expected and not is_positive_actual:
-            self.true_negative += 1
-        elif not is_positive_expected and is_positive_actual:
-            self.false_positive += 1
-        else:  # is_positive_expected and not is_positive_actual
-            self.false_negative += 1
+            if error_type == "Timeout":
+                self.timeout_count += 1
         
         # Track by category
         if category:
-            self.category_results[category].append(record)
+            self.category_rows[category].append(row)
     
     def _categorize_error(self, error: Optional[str]) -> str:
         """Categorize error for aggregation."""
@@ -214,16 +239,10 @@ class MetricsCollector:
             return "Unknown"
         
         error_lower = error.lower()
-        if "timeout" in error_lower:
-            return "Timeout"
-        elif "network" in error_lower or "connection" in error_lower:
-            return "Network Error"
-        elif "http" in error_lower:
-            return "HTTP Error"
-        elif "api" in error_lower:
-            return "API Error"
-        else:
-            return "Other"
+        for needles, category in ERROR_CATEGORIES:
+            if any(needle in error_lower for needle in needles):
+                return category
+        return "Other"
     
     def calculate(self) -> BenchmarkMetrics:
         """
@@ -232,6 +251,18 @@ class MetricsCollector:
         Returns:
             BenchmarkMetrics with all calculated values
         """
+        columns = self.results
+        success = np.asarray(columns.success, dtype=np.int8).astype(bool)
+        match = np.asarray(columns.match, dtype=np.int8)
+        
+        # Confusion matrix in one pass: index = 2 * y_true + y_pred
+        tn, fp, fn, tp = (
+            int(c) for c in np.bincount(
+                2 * np.asarray(columns.y_true, dtype=np.int8) + np.asarray(columns.y_pred, dtype=np.int8),
+                minlength=4,
+            )
+        )
+        
         metrics = BenchmarkMetrics(
             provider=self.provider,
             content_type=self.content_type,
@@ -239,54 +270,44 @@ class MetricsCollector:
             success_count=self.success_count,
             fail_count=self.fail_count,
             timeout_count=self.timeout_count,
-            true_positive=self.true_positive,
-            true_negative=self.true_negative,
-            false_positive=self.false_positive,
-            false_negative=self.false_negative,
+            true_positive=tp,
+            true_negative=tn,
+            false_positive=fp,
+            false_negative=fn,
             error_types=dict(self.error_types),
         )
         
         # Calculate response time percentiles
-        if self.response_times:
-            sorted_times = sorted(self.response_times)
-            n = len(sorted_times)
-            
-            metrics.response_times = sorted_times
-            metrics.avg_response_time = sum(sorted_times) / n
-            metrics.min_response_time = sorted_times[0]
-            metrics.max_response_time = sorted_times[-1]
-            metrics.p50_response_time = self._percentile(sorted_times, 50)
-            metrics.p95_response_time = self._percentile(sorted_times, 95)
-            metrics.p99_response_time = self._percentile(sorted_times, 99)
+        times = np.asarray(columns.response_time, dtype=np.float64)[success]
+        if times.size:
+            metrics.avg_response_time = float(times.mean())
+            metrics.min_response_time = float(times.min())
+            metrics.max_response_time = float(times.max())
+            (
+                metrics.p50_response_time,
+                metrics.p95_response_time,
+                metrics.p99_response_time,
+            ) = self._percentiles(times, (50, 95, 99))
         
         # Calculate duration and QPS
-        if self.start_time and self.end_time:
-            metrics.total_duration = self.end_time - self.start_time
+        if self.start_ns is not None and self.end_ns is not None:
+            metrics.total_duration = (self.end_ns - self.start_ns) / 1e9
             if metrics.total_duration > 0:
                 metrics.qps = metrics.success_count / metrics.total_duration
         
         # Calculate accuracy metrics
-        total_predictions = (
-            self.true_positive + self.true_negative + 
-            self.false_positive + self.false_negative
-        )
+        total_predictions = tp + tn + fp + fn
         
         if total_predictions > 0:
-            metrics.accuracy = (
-                (self.true_positive + self.true_negative) / total_predictions
-            ) * 100
+            metrics.accuracy = ((tp + tn) / total_predictions) * 100
         
         # Precision: TP / (TP + FP)
-        if self.true_positive + self.false_positive > 0:
-            metrics.precision = (
-                self.true_positive / (self.true_positive + self.false_positive)
-            ) * 100
+        if tp + fp > 0:
+            metrics.precision = (tp / (tp + fp)) * 100
         
         # Recall: TP / (TP + FN)
-        if self.true_positive + self.false_negative > 0:
-            metrics.recall = (
-                self.true_positive / (self.true_positive + self.false_negative)
-            ) * 100
+        if tp + fn > 0:
+            metrics.recall = (tp / (tp + fn)) * 100
         
         # F1 Score
         if metrics.precision + metrics.recall > 0:
@@ -296,47 +317,46 @@ class MetricsCollector:
             )
         
         # Calculate per-category metrics
-        for category, results in self.category_results.items():
-            category_success = sum(1 for r in results if r["success"])
-            category_match = sum(
-                1 for r in results 
-                if r["success"] and self._is_match(r["expected"], r["actual"])
-            )
+        for category, rows in self.category_rows.items():
+            index = np.asarray(rows, dtype=np.int64)
+            category_success = int(success[index].sum())
+            category_match = int(match[index].sum())
             
             metrics.category_metrics[category] = {
-                "total": len(results),
+                "total": len(rows),
                 "success": category_success,
                 "match_count": category_match,
-                "match_rate": (category_match / len(results) * 100) if results else 0,
+                "match_rate": (category_match / len(rows) * 100) if rows else 0,
             }
         
         return metrics
     
-    def _percentile(self, sorted_data: List[float], percentile: int) -> float:
-        """Calculate percentile value."""
-        if not sorted_data:
-            return 0.0
+    def _percentiles(self, data: np.ndarray, percentiles: Tuple[int, ...]) -> List[float]:
+        """
+        Calculate several percentile values without a full sort.
         
-        n = len(sorted_data)
-        index = int(n * percentile / 100)
-        index = min(index, n - 1)
+        Uses the nearest-rank index int(n * p / 100); np.partition places
+        each requested rank in O(n).
+        """
+        n = data.size
+        if n == 0:
+            return [0.0] * len(percentiles)
+        
+        indices = [min(int(n * p / 100), n - 1) for p in percentiles]
+        partitioned = np.partition(data, indices)
         
-        return sorted_data[index]
+        return [float(partitioned[i]) for i in indices]
     
     def _is_match(self, expected: str, actual: str) -> bool:
         """Check if expected and actual labels match."""
-        # Exact match
+        # Exact match (covers both "safe")
         if expected == actual:
             return True
         
-        # Both indicate "safe"
-        if expected == "正常" and actual == "正常":
-            return True
-        
-        # Both indicate "risky" (relaxed matching)
-        if expected != "正常" and actual != "正常":
-            # Check if actual contains expected or vice versa
-            if expected in actual or actual in expected:
-                return True
+        # A safe label only matches itself
+        if expected == SAFE_LABEL or actual == SAFE_LABEL:
+            return False
         
-        return False
+        # Both indicate "risky" (relaxed matching):
+        # check if actual contains expected or vice versa
+        return expected in actual or actual in expected
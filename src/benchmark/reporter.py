@@ -3,17 +3,130 @@ Report generation for benchmark results.
 Supports Markdown and JSON output formats.
 """
 
-import json
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 from .metrics import BenchmarkMetrics
 from .runner import BenchmarkResult
-from .utils import get_machine_info, get_report_subdir_name
+from .utils import get_machine_info, get_report_subdir_name, dump_json
 from ..config import Config
 
 
+# Comparison table rows: (label, metric attribute, scale, format spec)
+PERFORMANCE_ROWS = [
+    ("平均响应(ms)", "avg_response_time", 1000, ".0f"),
+    ("P99响应(ms)", "p99_response_time", 1000, ".0f"),
+    ("成功率(%)", "success_rate", 1, ".1f"),
+    ("QPS", "qps", 1, ".1f"),
+]
+
+ACCURACY_ROWS = [
+    ("准确率(%)", "accuracy", 1, ".1f"),
+    ("精确率(%)", "precision", 1, ".1f"),
+    ("召回率(%)", "recall", 1, ".1f"),
+    ("F1分数", "f1_score", 1, ".1f"),
+]
+
+
+# Markdown test environment table, filled from Reporter._test_environment
+ENVIRONMENT_SECTION_TEMPLATE = "\n".join([
+    "## 测试环境\n",
+    "| 项目 | 信息 |",
+    "|------|------|",
+    "| 区域 (Region) | {region} |",
+    "| 可用区 (AZ) | {availability_zone} |",
+    "| 实例ID | {instance_id} |",
+    "| 主机名 | {hostname} |",
+    "| IP地址 | {ip_address} |",
+    "| 操作系统 | {platform} |",
+    "\n---\n",
+])
+
+# Markdown for one content type's metrics; error rows are appended after it
+METRICS_SECTION_TEMPLATE = "\n".join([
+    "\n## {title}\n",
+    # Overview table
+    "### 概览\n",
+    "| 指标 | 数值 |",
+    "|------|------|",
+    "| 请求总数 | {m.total_requests} |",
+    "| 成功数 | {m.success_count} |",
+    "| 失败数 | {m.fail_count} |",
+    "| 成功率 | {m.success_rate:.2f}% |",
+    # Performance table
+    "\n### 性能指标\n",
+    "| 指标 | 数值 |",
+    "|------|------|",
+    "| 平均响应时间 | {avg_ms:.0f}ms |",
+    "| P50响应时间 | {p50_ms:.0f}ms |",
+    "| P95响应时间 | {p95_ms:.0f}ms |",
+    "| P99响应时间 | {p99_ms:.0f}ms |",
+    "| 最小响应时间 | {min_ms:.0f}ms |",
+    "| 最大响应时间 | {max_ms:.0f}ms |",
+    "| QPS (每秒查询数) | {m.qps:.2f} |",
+    "| 总耗时 | {m.total_duration:.1f}秒 |",
+    # Accuracy table
+    "\n### 准确性指标\n",
+    "| 指标 | 数值 |",
+    "|------|------|",
+    "| 准确率 | {m.accuracy:.2f}% |",
+    "| 精确率 | {m.precision:.2f}% |",
+    "| 召回率 | {m.recall:.2f}% |",
+    "| F1分数 | {m.f1_score:.2f} |",
+    # Confusion matrix
+    "\n### 混淆矩阵\n",
+    "| | 预测为违规 | 预测为正常 |",
+    "|---|---|---|",
+    "| **实际违规** | TP: {m.true_positive} | FN: {m.false_negative} |",
+    "| **实际正常** | FP: {m.false_positive} | TN: {m.true_negative} |",
+])
+
+# Summary paragraph for one content type
+SUMMARY_SECTION_TEMPLATE = "\n".join([
+    "**{title}:**",
+    "- 处理 {m.total_requests} 个请求，成功率 {m.success_rate:.1f}%",
+    "- 平均响应时间: {avg_ms:.0f}ms，P99: {p99_ms:.0f}ms",
+    "- 准确率: {m.accuracy:.1f}%，召回率: {m.recall:.1f}%，F1: {m.f1_score:.1f}",
+])
+
+ERROR_SECTION_HEADER = "\n".join([
+    "\n### 错误统计\n",
+    "| 错误类型 | 数量 |",
+    "|----------|------|",
+])
+
+SCENE_SECTION_HEADER = "\n".join([
+    "\n### 场景推荐\n",
+    "| 使用场景 | 推荐供应商 | 原因 |",
+    "|----------|------------|------|",
+])
+
+# Horizontal rule framing the console summary
+SUMMARY_RULE = "=" * 60
+
+# Console summary block for one content type
+CONSOLE_SECTION_TEMPLATE = "\n".join([
+    "\n{title}:",
+    "   请求总数: {m.total_requests}",
+    "   成功率: {m.success_rate:.1f}%",
+    "   平均响应: {avg_ms:.0f}ms",
+    "   P99响应: {p99_ms:.0f}ms",
+    "   准确率: {m.accuracy:.1f}%",
+    "   召回率: {m.recall:.1f}%",
+    "   F1分数: {m.f1_score:.1f}",
+])
+
+
+def _file_timestamp(now: datetime) -> str:
+    """Format a timestamp for report filenames (YYYYMMDD_HHMMSS) without strftime."""
+    return (
+        f"{now.year:04d}{now.month:02d}{now.day:02d}_"
+        f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+    )
+
+
 class Reporter:
     """
     Generate benchmark reports in various formats.
@@ -49,6 +162,17 @@ class Reporter:
         
         # Cache machine info for this reporter instance
         self._machine_info = get_machine_info()
+        
+        # Environment fields shared by every report this instance writes
+        machine_info = self._machine_info
+        self._test_environment = {
+            "region": machine_info["region"],
+            "availability_zone": machine_info["availability_zone"],
+            "instance_id": machine_info["instance_id"],
+            "hostname": machine_info["hostname"],
+            "ip_address": machine_info["ip_address"],
+            "platform": machine_info["platform"],
+        }
     
     def generate_markdown(
         self,
@@ -65,52 +189,41 @@ class Reporter:
         Returns:
             Path to generated file
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        file_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.isoformat(sep=" ", timespec="seconds")
+        file_timestamp = _file_timestamp(now)
         
         if not filename:
             filename = f"benchmark_report_{result.provider}_{file_timestamp}.md"
         
         output_path = self.output_dir / filename
         
-        # Use cached machine info
-        machine_info = self._machine_info
-        
-        lines = []
-        lines.append(f"# 内容审核性能测试报告")
-        lines.append(f"\n**供应商:** {result.provider}")
-        lines.append(f"**生成时间:** {timestamp}")
-        lines.append(f"\n---\n")
-        
-        # Machine info section
-        lines.append("## 测试环境\n")
-        lines.append("| 项目 | 信息 |")
-        lines.append("|------|------|")
-        lines.append(f"| 区域 (Region) | {machine_info['region']} |")
-        lines.append(f"| 可用区 (AZ) | {machine_info['availability_zone']} |")
-        lines.append(f"| 实例ID | {machine_info['instance_id']} |")
-        lines.append(f"| 主机名 | {machine_info['hostname']} |")
-        lines.append(f"| IP地址 | {machine_info['ip_address']} |")
-        lines.append(f"| 操作系统 | {machine_info['platform']} |")
-        lines.append(f"\n---\n")
+        lines = [
+            "# 内容审核性能测试报告",
+            f"\n**供应商:** {result.provider}",
+            f"**生成时间:** {timestamp}",
+            "\n---\n",
+            # Machine info section
+            ENVIRONMENT_SECTION_TEMPLATE.format_map(self._test_environment),
+        ]
         
         # Text metrics
         if result.text_metrics:
-            lines.append(self._format_metrics_section(
+            lines.extend(self._format_metrics_section(
                 "文本审核", 
                 result.text_metrics,
             ))
         
         # Image metrics
         if result.image_metrics:
-            lines.append(self._format_metrics_section(
+            lines.extend(self._format_metrics_section(
                 "图片审核",
                 result.image_metrics,
             ))
         
         # Summary
         lines.append("\n## 总结\n")
-        lines.append(self._generate_summary(result))
+        lines.extend(self._generate_summary(result))
         
         content = "\n".join(lines)
         
@@ -123,84 +236,56 @@ class Reporter:
         self, 
         title: str, 
         metrics: BenchmarkMetrics,
-    ) -> str:
-        """Format a metrics section for Markdown."""
-        lines = []
-        lines.append(f"\n## {title}\n")
-        
-        # Overview table
-        lines.append("### 概览\n")
-        lines.append("| 指标 | 数值 |")
-        lines.append("|------|------|")
-        lines.append(f"| 请求总数 | {metrics.total_requests} |")
-        lines.append(f"| 成功数 | {metrics.success_count} |")
-        lines.append(f"| 失败数 | {metrics.fail_count} |")
-        lines.append(f"| 成功率 | {metrics.success_rate:.2f}% |")
-        
-        # Performance table
-        lines.append("\n### 性能指标\n")
-        lines.append("| 指标 | 数值 |")
-        lines.append("|------|------|")
-        lines.append(f"| 平均响应时间 | {metrics.avg_response_time*1000:.0f}ms |")
-        lines.append(f"| P50响应时间 | {metrics.p50_response_time*1000:.0f}ms |")
-        lines.append(f"| P95响应时间 | {metrics.p95_response_time*1000:.0f}ms |")
-        lines.append(f"| P99响应时间 | {metrics.p99_response_time*1000:.0f}ms |")
-        lines.append(f"| 最小响应时间 | {metrics.min_response_time*1000:.0f}ms |")
-        lines.append(f"| 最大响应时间 | {metrics.max_response_time*1000:.0f}ms |")
-        lines.append(f"| QPS (每秒查询数) | {metrics.qps:.2f} |")
-        lines.append(f"| 总耗时 | {metrics.total_duration:.1f}秒 |")
-        
-        # Accuracy table
-        lines.append("\n### 准确性指标\n")
-        lines.append("| 指标 | 数值 |")
-        lines.append("|------|------|")
-        lines.append(f"| 准确率 | {metrics.accuracy:.2f}% |")
-        lines.append(f"| 精确率 | {metrics.precision:.2f}% |")
-        lines.append(f"| 召回率 | {metrics.recall:.2f}% |")
-        lines.append(f"| F1分数 | {metrics.f1_score:.2f} |")
-        
-        # Confusion matrix
-        lines.append("\n### 混淆矩阵\n")
-        lines.append("| | 预测为违规 | 预测为正常 |")
-        lines.append("|---|---|---|")
-        lines.append(f"| **实际违规** | TP: {metrics.true_positive} | FN: {metrics.false_negative} |")
-        lines.append(f"| **实际正常** | FP: {metrics.false_positive} | TN: {metrics.true_negative} |")
+    ) -> List[str]:
+        """Format a metrics section for Markdown, as chunks to join with newlines."""
+        lines = [METRICS_SECTION_TEMPLATE.format(
+            title=title,
+            m=metrics,
+            avg_ms=metrics.avg_response_time * 1000,
+            p50_ms=metrics.p50_response_time * 1000,
+            p95_ms=metrics.p95_response_time * 1000,
+            p99_ms=metrics.p99_response_time * 1000,
+            min_ms=metrics.min_response_time * 1000,
+            max_ms=metrics.max_response_time * 1000,
+        )]
         
         # Errors
         if metrics.error_types:
-            lines.append("\n### 错误统计\n")
-            lines.append("| 错误类型 | 数量 |")
-            lines.append("|----------|------|")
-            for error_type, count in metrics.error_types.items():
-                lines.append(f"| {error_type} | {count} |")
+            lines.append(ERROR_SECTION_HEADER)
+            lines.append("\n".join(
+                f"| {error_type} | {count} |"
+                for error_type, count in metrics.error_types.items()
+            ))
         
-        return "\n".join(lines)
+        return lines
     
-    def _generate_summary(self, result: BenchmarkResult) -> str:
-        """Generate summary section."""
+    def _generate_summary(self, result: BenchmarkResult) -> List[str]:
+        """Generate summary section lines."""
         lines = []
         
         if result.text_metrics:
-            tm = result.text_metrics
-            lines.append(f"**文本审核:**")
-            lines.append(f"- 处理 {tm.total_requests} 个请求，成功率 {tm.success_rate:.1f}%")
-            lines.append(f"- 平均响应时间: {tm.avg_response_time*1000:.0f}ms，P99: {tm.p99_response_time*1000:.0f}ms")
-            lines.append(f"- 准确率: {tm.accuracy:.1f}%，召回率: {tm.recall:.1f}%，F1: {tm.f1_score:.1f}")
+            lines.append(self._format_summary_section("文本审核", result.text_metrics))
             lines.append("")
         
         if result.image_metrics:
-            im = result.image_metrics
-            lines.append(f"**图片审核:**")
-            lines.append(f"- 处理 {im.total_requests} 个请求，成功率 {im.success_rate:.1f}%")
-            lines.append(f"- 平均响应时间: {im.avg_response_time*1000:.0f}ms，P99: {im.p99_response_time*1000:.0f}ms")
-            lines.append(f"- 准确率: {im.accuracy:.1f}%，召回率: {im.recall:.1f}%，F1: {im.f1_score:.1f}")
+            lines.append(self._format_summary_section("图片审核", result.image_metrics))
         
-        return "\n".join(lines)
+        return lines
+    
+    def _format_summary_section(self, title: str, metrics: BenchmarkMetrics) -> str:
+        """Format the summary paragraph for one content type."""
+        return SUMMARY_SECTION_TEMPLATE.format(
+            title=title,
+            m=metrics,
+            avg_ms=metrics.avg_response_time * 1000,
+            p99_ms=metrics.p99_response_time * 1000,
+        )
     
     def generate_json(
         self,
         result: BenchmarkResult,
         filename: Optional[str] = None,
+        compress: bool = False,
     ) -> str:
         """
         Generate JSON benchmark results.
@@ -208,37 +293,40 @@ class Reporter:
         Args:
             result: Benchmark result to export
             filename: Output filename (optional)
+            compress: Write zstd-compressed output (.json.zst, requires zstandard)
             
         Returns:
             Path to generated file
         """
-        file_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        file_timestamp = _file_timestamp(now)
         
         if not filename:
             filename = f"benchmark_results_{result.provider}_{file_timestamp}.json"
+        if compress and not filename.endswith(".zst"):
+            filename += ".zst"
         
         output_path = self.output_dir / filename
         
-        # Use cached machine info
-        machine_info = self._machine_info
-        
         data = {
             "provider": result.provider,
-            "generated_at": datetime.now().isoformat(),
-            "test_environment": {
-                "region": machine_info["region"],
-                "availability_zone": machine_info["availability_zone"],
-                "instance_id": machine_info["instance_id"],
-                "hostname": machine_info["hostname"],
-                "ip_address": machine_info["ip_address"],
-                "platform": machine_info["platform"],
-            },
+            "generated_at": now.isoformat(),
+            "test_environment": self._test_environment,
             "text_metrics": result.text_metrics.to_dict() if result.text_metrics else None,
             "image_metrics": result.image_metrics.to_dict() if result.image_metrics else None,
         }
         
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        payload = dump_json(data)
+        
+        if compress:
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError("zstandard is required for compressed output. Install with: pip install zstandard")
+            payload = zstandard.ZstdCompressor(level=3).compress(payload)
+        
+        with open(output_path, "wb") as f:
+            f.write(payload)
         
         return str(output_path)
     
@@ -257,19 +345,21 @@ class Reporter:
         Returns:
             Path to generated file
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        file_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        now = datetime.now()
+        timestamp = now.isoformat(sep=" ", timespec="seconds")
+        file_timestamp = _file_timestamp(now)
         
         if not filename:
             filename = f"benchmark_comparison_{file_timestamp}.md"
         
         output_path = self.output_dir / filename
         
-        lines = []
-        lines.append("# 内容审核供应商对比报告")
-        lines.append(f"\n**生成时间:** {timestamp}")
-        lines.append(f"**对比供应商:** {', '.join(results.keys())}")
-        lines.append("\n---\n")
+        lines = [
+            "# 内容审核供应商对比报告",
+            f"\n**生成时间:** {timestamp}",
+            f"**对比供应商:** {', '.join(results.keys())}",
+            "\n---\n",
+        ]
         
         # Text comparison
         text_results = {
@@ -277,7 +367,7 @@ class Reporter:
             if v.text_metrics
         }
         if text_results:
-            lines.append(self._format_comparison_table(
+            lines.extend(self._format_comparison_table(
                 "文本审核对比",
                 text_results,
             ))
@@ -288,14 +378,14 @@ class Reporter:
             if v.image_metrics
         }
         if image_results:
-            lines.append(self._format_comparison_table(
+            lines.extend(self._format_comparison_table(
                 "图片审核对比",
                 image_results,
             ))
         
         # Recommendations
         lines.append("\n## 建议\n")
-        lines.append(self._generate_recommendations(results))
+        lines.extend(self._generate_recommendations(text_results))
         
         content = "\n".join(lines)
         
@@ -308,129 +398,104 @@ class Reporter:
         self,
         title: str,
         metrics_dict: Dict[str, BenchmarkMetrics],
-    ) -> str:
-        """Format a comparison table for multiple providers."""
+    ) -> List[str]:
+        """Format comparison table lines for multiple providers."""
         lines = []
         lines.append(f"\n## {title}\n")
         
-        providers = list(metrics_dict.keys())
+        metrics_list = list(metrics_dict.values())
         
         # Performance comparison
         lines.append("### 性能对比\n")
-        header = "| 指标 |" + "|".join(f" {p} " for p in providers) + "|"
-        separator = "|------|" + "|".join("------" for _ in providers) + "|"
+        header = "| 指标 |" + "|".join(f" {p} " for p in metrics_dict) + "|"
+        separator = "|------|" + "|".join("------" for _ in metrics_dict) + "|"
         lines.append(header)
         lines.append(separator)
-        
-        rows = [
-            ("平均响应(ms)", lambda m: f"{m.avg_response_time*1000:.0f}"),
-            ("P99响应(ms)", lambda m: f"{m.p99_response_time*1000:.0f}"),
-            ("成功率(%)", lambda m: f"{m.success_rate:.1f}"),
-            ("QPS", lambda m: f"{m.qps:.1f}"),
-        ]
-        
-        for label, getter in rows:
-            row = f"| {label} |"
-            for p in providers:
-                row += f" {getter(metrics_dict[p])} |"
-            lines.append(row)
+        lines.extend(self._format_comparison_rows(PERFORMANCE_ROWS, metrics_list))
         
         # Accuracy comparison
         lines.append("\n### 准确性对比\n")
         lines.append(header)
         lines.append(separator)
+        lines.extend(self._format_comparison_rows(ACCURACY_ROWS, metrics_list))
         
-        rows = [
-            ("准确率(%)", lambda m: f"{m.accuracy:.1f}"),
-            ("精确率(%)", lambda m: f"{m.precision:.1f}"),
-            ("召回率(%)", lambda m: f"{m.recall:.1f}"),
-            ("F1分数", lambda m: f"{m.f1_score:.1f}"),
+        return lines
+    
+    def _format_comparison_rows(
+        self,
+        rows: List[tuple],
+        metrics_list: List[BenchmarkMetrics],
+    ) -> List[str]:
+        """Format one Markdown table row per (label, attribute, scale, spec) entry."""
+        return [
+            f"| {label} | "
+            + " | ".join(format(getattr(m, attr) * scale, spec) for m in metrics_list)
+            + " |"
+            for label, attr, scale, spec in rows
         ]
-        
-        for label, getter in rows:
-            row = f"| {label} |"
-            for p in providers:
-                row += f" {getter(metrics_dict[p])} |"
-            lines.append(row)
-        
-        return "\n".join(lines)
     
     def _generate_recommendations(
         self, 
-        results: Dict[str, BenchmarkResult],
-    ) -> str:
-        """Generate recommendations based on results."""
+        text_results: Dict[str, BenchmarkMetrics],
+    ) -> List[str]:
+        """Generate recommendation lines from the per-provider text metrics."""
         lines = []
         
         # Find best performers
-        text_results = {
-            k: v.text_metrics for k, v in results.items()
-            if v.text_metrics
-        }
-        
         if text_results:
-            # Best response time
-            best_speed = min(
-                text_results.items(),
-                key=lambda x: x[1].avg_response_time,
-            )
-            lines.append(f"- **响应最快:** {best_speed[0]} (平均 {best_speed[1].avg_response_time*1000:.0f}ms)")
+            # One pass over the providers; strict comparisons keep the
+            # first provider on ties, as min()/max() did
+            best_speed_name = best_accuracy_name = best_recall_name = best_f1_name = None
+            best_speed = float("inf")
+            best_accuracy = best_recall = best_f1 = float("-inf")
+            for name, m in text_results.items():
+                if m.avg_response_time < best_speed:
+                    best_speed, best_speed_name = m.avg_response_time, name
+                if m.accuracy > best_accuracy:
+                    best_accuracy, best_accuracy_name = m.accuracy, name
+                if m.recall > best_recall:
+                    best_recall, best_recall_name = m.recall, name
+                if m.f1_score > best_f1:
+                    best_f1, best_f1_name = m.f1_score, name
             
-            # Best accuracy
-            best_accuracy = max(
-                text_results.items(),
-                key=lambda x: x[1].accuracy,
-            )
-            lines.append(f"- **准确率最高:** {best_accuracy[0]} ({best_accuracy[1].accuracy:.1f}%)")
-            
-            # Best recall
-            best_recall = max(
-                text_results.items(),
-                key=lambda x: x[1].recall,
-            )
-            lines.append(f"- **召回率最高:** {best_recall[0]} ({best_recall[1].recall:.1f}%)")
+            lines.append(f"- **响应最快:** {best_speed_name} (平均 {best_speed*1000:.0f}ms)")
+            lines.append(f"- **准确率最高:** {best_accuracy_name} ({best_accuracy:.1f}%)")
+            lines.append(f"- **召回率最高:** {best_recall_name} ({best_recall:.1f}%)")
         
-        lines.append("\n### 场景推荐\n")
-        lines.append("| 使用场景 | 推荐供应商 | 原因 |")
-        lines.append("|----------|------------|------|")
+        lines.append(SCENE_SECTION_HEADER)
         
         if text_results:
-            best_speed_name = min(text_results.items(), key=lambda x: x[1].avg_response_time)[0]
-            best_recall_name = max(text_results.items(), key=lambda x: x[1].recall)[0]
-            best_f1_name = max(text_results.items(), key=lambda x: x[1].f1_score)[0]
-            
             lines.append(f"| 实时审核 | {best_speed_name} | 响应速度最快 |")
             lines.append(f"| 高风险内容 | {best_recall_name} | 召回率最高，漏检最少 |")
             lines.append(f"| 综合平衡 | {best_f1_name} | F1分数最优 |")
         
-        return "\n".join(lines)
+        return lines
     
     def print_summary(self, result: BenchmarkResult) -> None:
         """Print a summary to console."""
-        print("\n" + "="*60)
-        print(f"📊 测试报告摘要: {result.provider}")
-        print("="*60)
+        # Collect every line and write once (print() would issue a second
+        # write for the newline), so the summary is not interleaved with
+        # log output from other threads
+        lines = [
+            "\n" + SUMMARY_RULE,
+            f"📊 测试报告摘要: {result.provider}",
+            SUMMARY_RULE,
+        ]
         
-        if result.text_metrics:
-            tm = result.text_metrics
-            print(f"\n📝 文本审核:")
-            print(f"   请求总数: {tm.total_requests}")
-            print(f"   成功率: {tm.success_rate:.1f}%")
-            print(f"   平均响应: {tm.avg_response_time*1000:.0f}ms")
-            print(f"   P99响应: {tm.p99_response_time*1000:.0f}ms")
-            print(f"   准确率: {tm.accuracy:.1f}%")
-            print(f"   召回率: {tm.recall:.1f}%")
-            print(f"   F1分数: {tm.f1_score:.1f}")
+        sections = (
+            ("📝 文本审核", result.text_metrics),
+            ("🖼️  图片审核", result.image_metrics),
+        )
+        for title, m in sections:
+            if not m:
+                continue
+            lines.append(CONSOLE_SECTION_TEMPLATE.format(
+                title=title,
+                m=m,
+                avg_ms=m.avg_response_time * 1000,
+                p99_ms=m.p99_response_time * 1000,
+            ))
         
-        if result.image_metrics:
-            im = result.image_metrics
-            print(f"\n🖼️  图片审核:")
-            print(f"   请求总数: {im.total_requests}")
-            print(f"   成功率: {im.success_rate:.1f}%")
-            print(f"   平均响应: {im.avg_response_time*1000:.0f}ms")
-            print(f"   P99响应: {im.p99_response_time*1000:.0f}ms")
-            print(f"   准确率: {im.accuracy:.1f}%")
-            print(f"   召回率: {im.recall:.1f}%")
-            print(f"   F1分数: {im.f1_score:.1f}")
-        
-        print("\n" + "="*60)
+        lines.append("\n" + SUMMARY_RULE + "\n")
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
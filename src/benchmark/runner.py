@@ -3,22 +3,30 @@ Benchmark runner for executing performance tests.
 """
 
 import csv
+import contextlib
 import time
 import logging
+import warnings
 from pathlib import Path
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional, Callable
 from dataclasses import dataclass, field
+from operator import attrgetter
 
 from ..providers.base import BaseProvider, ContentType, ModerationResult, RiskLevel
 from ..data.loader import TestCase, DataLoader
 from ..config import Config
-from .metrics import MetricsCollector, BenchmarkMetrics
-from .utils import get_report_subdir_name
+from .metrics import MetricsCollector, BenchmarkMetrics, SAFE_LABEL
+from .cache import ResponseCache
+from .utils import get_report_subdir_name, RequestPacer, dump_json
+from ..imaging import shared_image_encodings
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between "Progress: n/total" log lines
+PROGRESS_LOG_INTERVAL = 2.0
+
 
 @dataclass
 class BenchmarkConfig:
@@ -29,13 +37,24 @@ class BenchmarkConfig:
     test_text: bool = True
     test_image: bool = True
     
+    # Response cache (reuse successful API results across runs)
+    use_cache: bool = False
+    refresh_cache: bool = False
+    
+    # Send each distinct input to the provider once and share the result
+    dedup: bool = False
+    
+    # Run the text and image benchmarks at the same time (each with its own
+    # max_workers pool, so total concurrency doubles)
+    parallel_types: bool = False
+    
     # Data source
     data_file: Optional[str] = None
     text_sheet: str = "文本测试题"
     image_sheet: str = "图片测试题"
 
 
-@dataclass
+@dataclass(slots=True)
 class MismatchRecord:
     """Record of a mismatch between API result and ground truth."""
     case_id: str
@@ -45,10 +64,90 @@ class MismatchRecord:
     actual_risk_level: str
     actual_risk_label: str
     risk_description: str
-    response_time_ms: float
+    response_time_ms: int
     raw_response: str
 
 
+class MismatchWriter:
+    """
+    Append mismatch records to a CSV file as they are found.
+    
+    The file is created when the first record arrives, so content types
+    without mismatches leave no empty CSV behind.
+    """
+    
+    HEADERS = (
+        "case_id",
+        "content",
+        "content_type",
+        "expected_risk",
+        "actual_risk_level",
+        "actual_risk_label",
+        "risk_description",
+        "response_time_ms",
+        "raw_response",
+    )
+    
+    # Header names match MismatchRecord fields, so one getter builds a row
+    _row = attrgetter(*HEADERS)
+    
+    def __init__(self, filepath: Path):
+        """
+        Initialize writer.
+        
+        Args:
+            filepath: Output CSV file path
+        """
+        self.filepath = filepath
+        self.count = 0
+        self._file = None
+        self._writer = None
+    
+    def write(self, m: MismatchRecord) -> None:
+        """
+        Write one mismatch record, creating the file on first use.
+        
+        Args:
+            m: Mismatch record
+        """
+        if self._writer is None:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.filepath, "w", newline="", encoding="utf-8-sig", buffering=1 << 20)
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(self.HEADERS)
+        
+        self._writer.writerow(self._row(m))
+        self.count += 1
+    
+    def close(self) -> None:
+        """Flush and close the file if one was created."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+    
+    @classmethod
+    def read(cls, filepath: Optional[Path]) -> List[MismatchRecord]:
+        """
+        Load the records back from a mismatch CSV.
+        
+        Args:
+            filepath: CSV written by a MismatchWriter, or None
+            
+        Returns:
+            Mismatch records in file order (empty if there is no file)
+        """
+        if filepath is None or not filepath.exists():
+            return []
+        with open(filepath, newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            records = [MismatchRecord(*row) for row in reader]
+        for m in records:
+            m.response_time_ms = int(m.response_time_ms)
+        return records
+
+
 @dataclass
 class BenchmarkResult:
     """Result of a complete benchmark run."""
@@ -56,10 +155,35 @@ class BenchmarkResult:
     text_metrics: Optional[BenchmarkMetrics] = None
     image_metrics: Optional[BenchmarkMetrics] = None
     detailed_results: List[Dict[str, Any]] = field(default_factory=list)
-    text_mismatches: List[MismatchRecord] = field(default_factory=list)
-    image_mismatches: List[MismatchRecord] = field(default_factory=list)
+    text_mismatch_count: int = 0
+    image_mismatch_count: int = 0
+    # Mismatch CSVs written during the run (None when there were no mismatches)
+    text_mismatch_file: Optional[Path] = None
+    image_mismatch_file: Optional[Path] = None
     metadata: Optional[Dict[str, Any]] = None
     
+    @property
+    def text_mismatches(self) -> List[MismatchRecord]:
+        """Deprecated: text mismatches re-read from text_mismatch_file."""
+        warnings.warn(
+            "BenchmarkResult.text_mismatches is deprecated; use "
+            "text_mismatch_count and text_mismatch_file",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return MismatchWriter.read(self.text_mismatch_file)
+    
+    @property
+    def image_mismatches(self) -> List[MismatchRecord]:
+        """Deprecated: image mismatches re-read from image_mismatch_file."""
+        warnings.warn(
+            "BenchmarkResult.image_mismatches is deprecated; use "
+            "image_mismatch_count and image_mismatch_file",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return MismatchWriter.read(self.image_mismatch_file)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -107,6 +231,16 @@ class BenchmarkRunner:
             request_interval=Config.REQUEST_INTERVAL,
         )
         
+        # Match the provider's connection pool to the number of workers
+        self.provider.set_pool_size(self.config.max_workers)
+        self.provider.warmup()
+        
+        # Response cache, open only while run() is in progress
+        self.cache: Optional[ResponseCache] = None
+        
+        # Fraction of requests saved by dedup, per content type
+        self._dedup_ratios: Dict[str, float] = {}
+        
         # Callbacks
         self._on_progress: Optional[Callable[[int, int], None]] = None
         self._on_result: Optional[Callable[[TestCase, ModerationResult], None]] = None
@@ -155,20 +289,21 @@ class BenchmarkRunner:
             BenchmarkResult with metrics and detailed results
         """
         result = BenchmarkResult(provider=self.provider.name)
+        self._dedup_ratios.clear()
         
         # Load test data if file provided
         if data_file:
-            loader = DataLoader(data_file)
-            if test_text and not text_cases:
-                text_cases = loader.load_text_cases(
-                    sheet_name=self.config.text_sheet,
-                    limit=limit,
-                )
-            if test_image and not image_cases:
-                image_cases = loader.load_image_cases(
-                    sheet_name=self.config.image_sheet,
-                    limit=limit,
-                )
+            with DataLoader(data_file) as loader:
+                if test_text and not text_cases:
+                    text_cases = loader.load_text_cases(
+                        sheet_name=self.config.text_sheet,
+                        limit=limit,
+                    )
+                if test_image and not image_cases:
+                    image_cases = loader.load_image_cases(
+                        sheet_name=self.config.image_sheet,
+                        limit=limit,
+                    )
         
         # Apply limit
         if limit:
@@ -177,125 +312,246 @@ class BenchmarkRunner:
             if image_cases:
                 image_cases = image_cases[:limit]
         
-        # Run text benchmark
-        if test_text and text_cases:
-            logger.info(f"Starting text benchmark: {len(text_cases)} cases")
-            result.text_metrics, result.text_mismatches = self._run_benchmark(
-                text_cases, 
-                ContentType.TEXT,
-            )
-            logger.info(f"Text benchmark complete: {result.text_metrics.success_rate:.1f}% success")
-            if result.text_mismatches:
-                logger.info(f"Text mismatches: {len(result.text_mismatches)} cases")
-        
-        # Run image benchmark
-        if test_image and image_cases:
-            logger.info(f"Starting image benchmark: {len(image_cases)} cases")
-            result.image_metrics, result.image_mismatches = self._run_benchmark(
-                image_cases,
-                ContentType.IMAGE,
-            )
-            logger.info(f"Image benchmark complete: {result.image_metrics.success_rate:.1f}% success")
-            if result.image_mismatches:
-                logger.info(f"Image mismatches: {len(result.image_mismatches)} cases")
+        run_text = bool(test_text and text_cases)
+        run_image = bool(test_image and image_cases)
         
-        # Export mismatches to CSV
-        self._export_mismatches(result)
+        # Mismatch CSVs from this run share one timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        if self.config.use_cache or self.config.refresh_cache:
+            self.cache = ResponseCache(Config.OUTPUT_DIR / "cache" / "responses.sqlite3")
+        
+        try:
+            if run_text and run_image and self.config.parallel_types:
+                # Overlap the two network-bound runs; both pools share the session
+                self.provider.set_pool_size(2 * self.config.max_workers)
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    text_future = executor.submit(self._run_content_type, text_cases, ContentType.TEXT, timestamp)
+                    image_future = executor.submit(self._run_content_type, image_cases, ContentType.IMAGE, timestamp)
+                    result.text_metrics, result.text_mismatch_count, result.text_mismatch_file = text_future.result()
+                    result.image_metrics, result.image_mismatch_count, result.image_mismatch_file = image_future.result()
+                self.provider.set_pool_size(self.config.max_workers)
+            else:
+                # Run text benchmark
+                if run_text:
+                    result.text_metrics, result.text_mismatch_count, result.text_mismatch_file = self._run_content_type(
+                        text_cases,
+                        ContentType.TEXT,
+                        timestamp,
+                    )
+                
+                # Run image benchmark
+                if run_image:
+                    result.image_metrics, result.image_mismatch_count, result.image_mismatch_file = self._run_content_type(
+                        image_cases,
+                        ContentType.IMAGE,
+                        timestamp,
+                    )
+            
+            if self.cache:
+                logger.info(f"Response cache: {self.cache.hits} hits, {self.cache.misses} misses")
+        finally:
+            if self.cache:
+                self.cache.close()
+                self.cache = None
+        
+        if self._dedup_ratios:
+            result.metadata = result.metadata or {}
+            result.metadata["dedup_ratio"] = dict(self._dedup_ratios)
         
         return result
     
-    def _run_benchmark(
+    def _run_content_type(
         self,
         test_cases: List[TestCase],
         content_type: ContentType,
+        timestamp: str,
     ) -> tuple:
+        """
+        Run and log the benchmark for one content type.
+        
+        Mismatches are streamed to a CSV in the same subdirectory structure
+        as Reporter (YYYYMMDD_region_ip) while the benchmark runs.
+        
+        Args:
+            test_cases: List of test cases
+            content_type: Type of content being tested
+            timestamp: Timestamp used in the mismatch CSV filename
+            
+        Returns:
+            Tuple of (BenchmarkMetrics, number of mismatches, mismatch CSV
+            path or None if there were none)
+        """
+        label = content_type.value
+        mismatch_writer = MismatchWriter(
+            Config.REPORT_DIR / get_report_subdir_name()
+            / f"{label}_mismatches_{self.provider.name}_{timestamp}.csv"
+        )
+        
+        logger.info(f"Starting {label} benchmark: {len(test_cases)} cases")
+        try:
+            metrics = self._run_benchmark(test_cases, content_type, mismatch_writer)
+        finally:
+            mismatch_writer.close()
+        logger.info(f"{label.capitalize()} benchmark complete: {metrics.success_rate:.1f}% success")
+        
+        if mismatch_writer.count:
+            logger.info(f"{label.capitalize()} mismatches: {mismatch_writer.count} cases")
+            logger.info(f"{label.capitalize()} mismatches exported to: {mismatch_writer.filepath}")
+        return metrics, mismatch_writer.count, mismatch_writer.filepath if mismatch_writer.count else None
+    
+    def _run_benchmark(
+        self,
+        test_cases: List[TestCase],
+        content_type: ContentType,
+        mismatch_writer: MismatchWriter,
+    ) -> BenchmarkMetrics:
         """
         Run benchmark for a specific content type.
         
         Args:
             test_cases: List of test cases
             content_type: Type of content being tested
+            mismatch_writer: Destination for mismatch records
             
         Returns:
-            Tuple of (BenchmarkMetrics, List[MismatchRecord])
+            BenchmarkMetrics for the run
         """
         collector = MetricsCollector(
             provider=self.provider.name,
             content_type=content_type.value,
         )
         
-        mismatches: List[MismatchRecord] = []
+        groups = self._group_cases(test_cases, content_type)
+        
+        # Rate limiting happens in the workers, right before each API call,
+        # so results are collected while later requests are still waiting
+        pacer = RequestPacer(self.config.request_interval)
+        
+        # With one worker or one request there is nothing to overlap, so run
+        # on this thread instead of starting a pool
+        inline = self.config.max_workers == 1 or len(groups) <= 1
+        executor = None if inline else ThreadPoolExecutor(max_workers=self.config.max_workers)
         
         collector.start()
         
         # Use thread pool for concurrent execution
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            # Submit all tasks
-            futures = {}
-            for test_case in test_cases:
-                future = executor.submit(
-                    self._moderate_single,
-                    test_case,
-                    content_type,
+        with executor or contextlib.nullcontext():
+            # One request per group; every case in a group shares its result
+            if executor is None:
+                finished = (
+                    (self._call_inline(self._moderate_single, group[0], content_type, pacer), group)
+                    for group in groups
                 )
-                futures[future] = test_case
-                
-                # Rate limiting
-                time.sleep(self.config.request_interval)
+            else:
+                futures = {
+                    executor.submit(self._moderate_single, group[0], content_type, pacer): group
+                    for group in groups
+                }
+                finished = ((future, futures[future]) for future in as_completed(futures))
             
             # Collect results
             completed = 0
             total = len(test_cases)
+            last_progress_log = time.monotonic()
             
-            for future in as_completed(futures):
-                test_case = futures[future]
-                
-                try:
-                    mod_result = future.result()
-                    
-                    # Record metrics
-                    collector.record(
-                        mod_result,
-                        test_case.expected_risk,
-                        test_case.category,
-                    )
+            for future, group in finished:
+                for test_case in group:
+                    try:
+                        mod_result = future.result()
+                        
+                        # Record metrics
+                        collector.record(
+                            mod_result,
+                            test_case.expected_risk,
+                            test_case.category,
+                        )
+                        
+                        # Check for mismatch
+                        mismatch = self._check_mismatch(test_case, mod_result, content_type)
+                        if mismatch:
+                            mismatch_writer.write(mismatch)
+                        
+                        # Callback
+                        if self._on_result:
+                            self._on_result(test_case, mod_result)
+                        
+                    except Exception as e:
+                        logger.error(f"Error processing {test_case.id}: {e}")
+                        # Record as failed
+                        error_result = ModerationResult(
+                            success=False,
+                            error=str(e),
+                            provider=self.provider.name,
+                            content_type=content_type,
+                        )
+                        collector.record(
+                            error_result,
+                            test_case.expected_risk,
+                            test_case.category,
+                        )
                     
-                    # Check for mismatch
-                    mismatch = self._check_mismatch(test_case, mod_result, content_type)
-                    if mismatch:
-                        mismatches.append(mismatch)
+                    completed += 1
                     
-                    # Callback
-                    if self._on_result:
-                        self._on_result(test_case, mod_result)
+                    # Progress callback
+                    if self._on_progress:
+                        self._on_progress(completed, total)
                     
-                except Exception as e:
-                    logger.error(f"Error processing {test_case.id}: {e}")
-                    # Record as failed
-                    error_result = ModerationResult(
-                        success=False,
-                        error=str(e),
-                        provider=self.provider.name,
-                        content_type=content_type,
-                    )
-                    collector.record(
-                        error_result,
-                        test_case.expected_risk,
-                        test_case.category,
-                    )
-                
-                completed += 1
-                
-                # Progress callback
-                if self._on_progress:
-                    self._on_progress(completed, total)
-                
-                # Log progress
-                if completed % 100 == 0 or completed == total:
-                    logger.info(f"Progress: {completed}/{total}")
+                    # Log progress every 100 cases, at most once per
+                    # PROGRESS_LOG_INTERVAL seconds, and always at the end
+                    if completed == total or (
+                        completed % 100 == 0
+                        and time.monotonic() - last_progress_log >= PROGRESS_LOG_INTERVAL
+                    ):
+                        logger.info(f"Progress: {completed}/{total}")
+                        last_progress_log = time.monotonic()
         
         collector.stop()
-        return collector.calculate(), mismatches
+        return collector.calculate()
+    
+    @staticmethod
+    def _call_inline(fn: Callable, *args) -> Future:
+        """Call fn on this thread and wrap the outcome in a completed Future."""
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def _group_cases(
+        self,
+        test_cases: List[TestCase],
+        content_type: ContentType,
+    ) -> List[List[TestCase]]:
+        """
+        Group test cases that should share a single provider request.
+        
+        Without dedup every case is its own group. With dedup, cases whose
+        content is identical are grouped together in first-seen order.
+        
+        Args:
+            test_cases: List of test cases
+            content_type: Type of content being tested
+            
+        Returns:
+            List of non-empty case groups
+        """
+        if not self.config.dedup:
+            return [[test_case] for test_case in test_cases]
+        
+        groups: Dict[str, List[TestCase]] = {}
+        for test_case in test_cases:
+            groups.setdefault(test_case.content, []).append(test_case)
+        
+        ratio = 1 - len(groups) / len(test_cases) if test_cases else 0.0
+        self._dedup_ratios[content_type.value] = ratio
+        logger.info(
+            f"Dedup: {len(test_cases)} {content_type.value} cases -> "
+            f"{len(groups)} unique inputs ({ratio:.1%} saved)"
+        )
+        
+        return list(groups.values())
     
     def _check_mismatch(
         self,
@@ -318,101 +574,40 @@ class BenchmarkRunner:
             return None
         
         # Determine if results match
-        expected_is_risk = test_case.expected_risk != "正常"
-        actual_is_risk = mod_result.risk_level != RiskLevel.PASS
+        risk_level = mod_result.risk_level
+        expected_is_risk = test_case.expected_risk != SAFE_LABEL
+        actual_is_risk = risk_level is not RiskLevel.PASS
         
         # If both agree on risk/no-risk, no mismatch
         if expected_is_risk == actual_is_risk:
             return None
         
         # Create mismatch record
-        import json
+        raw_response = mod_result.raw_response
         raw_response_str = ""
-        if mod_result.raw_response:
+        if raw_response:
             try:
-                raw_response_str = json.dumps(mod_result.raw_response, ensure_ascii=False)
-            except:
-                raw_response_str = str(mod_result.raw_response)
+                raw_response_str = dump_json(raw_response, indent=False).decode("utf-8")
+            except Exception:
+                raw_response_str = str(raw_response)
         
         return MismatchRecord(
             case_id=test_case.id,
-            content=test_case.content[:500] if len(test_case.content) > 500 else test_case.content,
+            content=test_case.content[:500],
             content_type=content_type.value,
             expected_risk=test_case.expected_risk,
-            actual_risk_level=mod_result.risk_level.value if mod_result.risk_level else "N/A",
+            actual_risk_level=risk_level.value if risk_level else "N/A",
             actual_risk_label=mod_result.risk_label or "N/A",
-            risk_description=mod_result.raw_response.get("riskDescription", "") if mod_result.raw_response else "",
-            response_time_ms=mod_result.response_time * 1000 if mod_result.response_time else 0,
+            risk_description=raw_response.get("riskDescription", "") if raw_response else "",
+            response_time_ms=round(mod_result.response_time * 1000) if mod_result.response_time else 0,
             raw_response=raw_response_str,
         )
     
-    def _export_mismatches(self, result: BenchmarkResult) -> None:
-        """
-        Export mismatch records to CSV files.
-        
-        Args:
-            result: Benchmark result containing mismatches
-        """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        # Use same subdirectory structure as Reporter (YYYYMMDD_region_ip)
-        subdir_name = get_report_subdir_name()
-        output_dir = Config.REPORT_DIR / subdir_name
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Export text mismatches
-        if result.text_mismatches:
-            text_csv_path = output_dir / f"text_mismatches_{result.provider}_{timestamp}.csv"
-            self._write_mismatch_csv(text_csv_path, result.text_mismatches)
-            logger.info(f"Text mismatches exported to: {text_csv_path}")
-        
-        # Export image mismatches
-        if result.image_mismatches:
-            image_csv_path = output_dir / f"image_mismatches_{result.provider}_{timestamp}.csv"
-            self._write_mismatch_csv(image_csv_path, result.image_mismatches)
-            logger.info(f"Image mismatches exported to: {image_csv_path}")
-    
-    def _write_mismatch_csv(self, filepath: Path, mismatches: List[MismatchRecord]) -> None:
-        """
-        Write mismatch records to CSV file.
-        
-        Args:
-            filepath: Output CSV file path
-            mismatches: List of mismatch records
-        """
-        headers = [
-            "case_id",
-            "content",
-            "content_type",
-            "expected_risk",
-            "actual_risk_level",
-            "actual_risk_label",
-            "risk_description",
-            "response_time_ms",
-            "raw_response",
-        ]
-        
-        with open(filepath, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-            
-            for m in mismatches:
-                writer.writerow([
-                    m.case_id,
-                    m.content,
-                    m.content_type,
-                    m.expected_risk,
-                    m.actual_risk_level,
-                    m.actual_risk_label,
-                    m.risk_description,
-                    f"{m.response_time_ms:.0f}",
-                    m.raw_response,
-                ])
-    
     def _moderate_single(
         self,
         test_case: TestCase,
         content_type: ContentType,
+        pacer: Optional[RequestPacer] = None,
     ) -> ModerationResult:
         """
         Moderate a single test case.
@@ -420,20 +615,34 @@ class BenchmarkRunner:
         Args:
             test_case: Test case to moderate
             content_type: Content type
+            pacer: Rate limiter to wait on before calling the provider
             
         Returns:
             ModerationResult
         """
+        if self.cache and not self.config.refresh_cache:
+            cached = self.cache.get(self.provider.name, content_type, test_case.content)
+            if cached is not None:
+                return cached
+        
+        if pacer:
+            pacer.wait()
+        
         if content_type == ContentType.TEXT:
-            return self.provider.moderate_text(
+            mod_result = self.provider.moderate_text(
                 test_case.content,
                 token_id=f"benchmark_{test_case.id}",
             )
         else:
-            return self.provider.moderate_image(
+            mod_result = self.provider.moderate_image(
                 test_case.content,
                 token_id=f"benchmark_{test_case.id}",
             )
+        
+        if self.cache:
+            self.cache.put(self.provider.name, content_type, test_case.content, mod_result)
+        
+        return mod_result
     
     def run_quick_test(self, num_samples: int = 10) -> BenchmarkResult:
         """
@@ -478,8 +687,14 @@ class MultiProviderRunner:
         )
     """
     
-    def __init__(self):
-        """Initialize multi-provider runner."""
+    def __init__(self, config: Optional[BenchmarkConfig] = None):
+        """
+        Initialize multi-provider runner.
+        
+        Args:
+            config: Benchmark configuration shared by every provider run
+        """
+        self.config = config
         self.providers: List[BaseProvider] = []
         self.results: Dict[str, BenchmarkResult] = {}
     
@@ -494,6 +709,7 @@ class MultiProviderRunner:
         limit: Optional[int] = None,
         test_text: bool = True,
         test_image: bool = True,
+        parallel: bool = False,
     ) -> Dict[str, BenchmarkResult]:
         """
         Run benchmark comparison across all providers.
@@ -503,30 +719,42 @@ class MultiProviderRunner:
             limit: Maximum test cases per type
             test_text: Test text moderation
             test_image: Test image moderation
+            parallel: Benchmark all providers at the same time instead of
+                one after another
             
         Returns:
             Dictionary mapping provider name to results
         """
         # Load data once
-        loader = DataLoader(data_file)
-        text_cases = loader.load_text_cases(limit=limit) if test_text else None
-        image_cases = loader.load_image_cases(limit=limit) if test_image else None
+        with DataLoader(data_file) as loader:
+            text_cases = loader.load_text_cases(limit=limit) if test_text else None
+            image_cases = loader.load_image_cases(limit=limit) if test_image else None
         
         logger.info(f"Running comparison across {len(self.providers)} providers")
         
-        for provider in self.providers:
+        def run_provider(provider: BaseProvider) -> BenchmarkResult:
             logger.info(f"\n{'='*60}")
             logger.info(f"Testing provider: {provider.display_name}")
             logger.info(f"{'='*60}")
             
-            runner = BenchmarkRunner(provider)
-            result = runner.run(
+            runner = BenchmarkRunner(provider, self.config)
+            return runner.run(
                 text_cases=text_cases,
                 image_cases=image_cases,
                 test_text=test_text,
                 test_image=test_image,
             )
-            
+        
+        # Every provider gets the same local images; encode each one once
+        with shared_image_encodings():
+            if parallel and len(self.providers) > 1:
+                # Provider runs are network-bound, so threads overlap them well
+                with ThreadPoolExecutor(max_workers=len(self.providers)) as executor:
+                    results = list(executor.map(run_provider, self.providers))
+            else:
+                results = [run_provider(provider) for provider in self.providers]
+        
+        for provider, result in zip(self.providers, results):
             self.results[provider.name] = result
         
         return self.results
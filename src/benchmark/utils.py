@@ -6,16 +6,72 @@ Separated to avoid circular imports.
 import socket
 import platform
 import os
-import re
-import base64
+import json
+import math
+import threading
+import time
+import functools
+import http.client
 from datetime import datetime
-from typing import Dict
+from typing import Any, Dict
+
+# Re-exported for existing callers; the image helpers live in src.imaging
+from ..imaging import is_base64_image  # noqa: F401
+
+# orjson is optional; it serializes noticeably faster than the stdlib encoder
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dump_json(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes, using orjson when installed.
+    
+    Args:
+        data: JSON-serializable data (NumPy scalars and arrays allowed with orjson)
+        indent: Pretty-print with 2-space indentation
+        
+    Returns:
+        Encoded JSON; non-ASCII text is kept as-is rather than escaped.
+        Both encoders give the same layout: compact separators unless
+        indenting, and NaN/Infinity written as null.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    
+    kwargs = {"indent": 2} if indent else {"separators": (",", ":")}
+    try:
+        text = json.dumps(data, ensure_ascii=False, allow_nan=False, **kwargs)
+    except ValueError:
+        # Out-of-range floats are rare, so only walk the data when one is present
+        text = json.dumps(_nonfinite_to_none(data), ensure_ascii=False, **kwargs)
+    return text.encode("utf-8")
+
+
+def _nonfinite_to_none(data: Any) -> Any:
+    """Return a copy of data with NaN and infinite floats replaced by None."""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {k: _nonfinite_to_none(v) for k, v in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_nonfinite_to_none(v) for v in data]
+    return data
 
 
 def get_machine_info() -> Dict[str, str]:
     """
     Get machine information for report context.
     
+    The lookup (local IP probe plus EC2 metadata requests) runs once per
+    process; later calls return a copy of the cached result.
+    
     Returns:
         Dictionary with machine details including:
         - hostname: Machine hostname
@@ -24,6 +80,12 @@ def get_machine_info() -> Dict[str, str]:
         - instance_id: EC2 instance ID (if on EC2)
         - platform: OS platform info
     """
+    return dict(_collect_machine_info())
+
+
+@functools.lru_cache(maxsize=1)
+def _collect_machine_info() -> Dict[str, str]:
+    """Gather machine details; cached by get_machine_info()."""
     info = {
         "hostname": socket.gethostname(),
         "platform": f"{platform.system()} {platform.release()}",
@@ -32,99 +94,134 @@ def get_machine_info() -> Dict[str, str]:
         "availability_zone": "N/A",
     }
     
-    # Try to get local IP
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        info["ip_address"] = s.getsockname()[0]
-        s.close()
-    except Exception:
-        info["ip_address"] = "127.0.0.1"
+    info["ip_address"] = _get_local_ip(info["hostname"])
     
-    # Try to get AWS EC2 metadata (IMDSv2)
-    try:
-        import urllib.request
+    # Try to get AWS EC2 metadata (IMDSv2), unless this host is clearly not EC2
+    if not (_maybe_on_ec2() and _read_ec2_metadata(info)):
+        # Not on AWS EC2 or metadata not available
+        # Check for AWS_DEFAULT_REGION or AWS_REGION environment variable
+        info["region"] = os.environ.get("AWS_DEFAULT_REGION", 
+                                        os.environ.get("AWS_REGION", "local"))
+    
+    return info
+
+
+# Local markers for EC2: the DMI vendor on Nitro instances, the hypervisor
+# UUID prefix on Xen instances
+_EC2_DMI_VENDOR_PATH = "/sys/devices/virtual/dmi/id/sys_vendor"
+_EC2_HYPERVISOR_UUID_PATH = "/sys/hypervisor/uuid"
+
+
+def _maybe_on_ec2() -> bool:
+    """
+    Cheaply rule out EC2 before probing the metadata endpoint.
+    
+    Off EC2 the metadata address is usually black-holed, so each probe
+    waits out its timeout. Returns False only when the local markers are
+    readable and none of them points at EC2; otherwise the probe runs.
+    """
+    markers = []
+    for path in (_EC2_DMI_VENDOR_PATH, _EC2_HYPERVISOR_UUID_PATH):
+        try:
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                markers.append(f.read(64).strip().lower())
+        except OSError:
+            continue
+    
+    if not markers:
+        return True
+    return any(m.startswith("amazon") or m.startswith("ec2") for m in markers)
+
+
+def _read_ec2_metadata(info: Dict[str, str]) -> bool:
+    """
+    Fill in EC2 placement details from IMDSv2 over one keep-alive connection.
+    
+    Args:
+        info: Machine info dictionary to update in place
         
+    Returns:
+        True if all metadata was read, False otherwise
+    """
+    conn = http.client.HTTPConnection("169.254.169.254", timeout=1)
+    try:
         # First get token for IMDSv2
-        token_request = urllib.request.Request(
-            "http://169.254.169.254/latest/api/token",
-            method="PUT",
-            headers={"X-aws-ec2-metadata-token-ttl-seconds": "21600"}
+        token = _imds_request(
+            conn, "PUT", "/latest/api/token",
+            {"X-aws-ec2-metadata-token-ttl-seconds": "21600"},
         )
-        token_request.timeout = 1
-        
-        with urllib.request.urlopen(token_request, timeout=1) as response:
-            token = response.read().decode('utf-8')
         
         headers = {"X-aws-ec2-metadata-token": token}
         
         # Get availability zone
-        az_request = urllib.request.Request(
-            "http://169.254.169.254/latest/meta-data/placement/availability-zone",
-            headers=headers
-        )
-        with urllib.request.urlopen(az_request, timeout=1) as response:
-            az = response.read().decode('utf-8')
-            info["availability_zone"] = az
-            # Region is AZ without the last character (e.g., us-east-1a -> us-east-1)
-            info["region"] = az[:-1]
+        az = _imds_request(conn, "GET", "/latest/meta-data/placement/availability-zone", headers)
+        info["availability_zone"] = az
+        # Region is AZ without the last character (e.g., us-east-1a -> us-east-1)
+        info["region"] = az[:-1]
         
         # Get instance ID
-        instance_request = urllib.request.Request(
-            "http://169.254.169.254/latest/meta-data/instance-id",
-            headers=headers
-        )
-        with urllib.request.urlopen(instance_request, timeout=1) as response:
-            info["instance_id"] = response.read().decode('utf-8')
-            
+        info["instance_id"] = _imds_request(conn, "GET", "/latest/meta-data/instance-id", headers)
+        return True
     except Exception:
-        # Not on AWS EC2 or metadata not available
-        # Check for AWS_DEFAULT_REGION or AWS_REGION environment variable
-        info["region"] = os.environ.get("AWS_DEFAULT_REGION", 
-                                        os.environ.get("AWS_REGION", "local"))
-    
-    return info
+        return False
+    finally:
+        conn.close()
 
 
-def is_base64_image(content: str) -> bool:
+def _get_local_ip(hostname: str) -> str:
     """
-    Check if the content is a base64 encoded image.
+    Find the machine's local IP address.
+    
+    Prefers POD_IP (set by Kubernetes), then the address of the interface
+    that routes outbound traffic (a UDP connect sends no packets). The
+    resolver's first non-loopback IPv4 address for the hostname is only a
+    fallback for hosts without a default route.
     
     Args:
-        content: String to check
+        hostname: Machine hostname
         
     Returns:
-        True if content appears to be base64 image data
+        Local IP address, or 127.0.0.1 if none can be determined
     """
-    if not content or len(content) < 100:
-        return False
-    
-    # Check if it starts with data URI scheme
-    if content.startswith('data:image/'):
-        return True
+    pod_ip = os.environ.get("POD_IP")
+    if pod_ip:
+        return pod_ip
     
-    # Check if it looks like raw base64 (no URL-like patterns)
-    if content.startswith(('http://', 'https://', '/')):
-        return False
-    
-    # Check for valid base64 characters
-    base64_pattern = re.compile(r'^[A-Za-z0-9+/=]+$')
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except OSError:
+        pass
     
-    # Sample first 1000 chars for efficiency
-    sample = content[:1000].replace('\n', '').replace('\r', '').replace(' ', '')
+    try:
+        for *_, sockaddr in socket.getaddrinfo(hostname, None, socket.AF_INET):
+            if not sockaddr[0].startswith("127."):
+                return sockaddr[0]
+    except OSError:
+        pass
     
-    if not base64_pattern.match(sample):
-        return False
+    return "127.0.0.1"
+
+
+def _imds_request(
+    conn: http.client.HTTPConnection,
+    method: str,
+    path: str,
+    headers: Dict[str, str],
+) -> str:
+    """
+    Issue one EC2 instance metadata request on an open connection.
     
-    # Try to decode a small portion to verify
-    try:
-        # Base64 strings should have length divisible by 4
-        test_len = min(100, len(sample))
-        test_len = test_len - (test_len % 4)
-        base64.b64decode(sample[:test_len])
-        return True
-    except Exception:
-        return False
+    Raises:
+        OSError: If the endpoint answers with a non-200 status
+    """
+    conn.request(method, path, headers=headers)
+    response = conn.getresponse()
+    body = response.read().decode('utf-8')
+    if response.status != 200:
+        raise OSError(f"IMDS {path} returned HTTP {response.status}")
+    return body
 
 
 def get_report_subdir_name() -> str:
@@ -137,9 +234,51 @@ def get_report_subdir_name() -> str:
     Returns:
         Subdirectory name string
     """
-    machine_info = get_machine_info()
-    date_str = datetime.now().strftime("%Y%m%d")
+    return _report_subdir_name(datetime.now().strftime("%Y%m%d"))
+
+
+@functools.lru_cache(maxsize=4)
+def _report_subdir_name(date_str: str) -> str:
+    """Build the subdirectory name for one date; machine info never changes."""
+    machine_info = _collect_machine_info()
     region = machine_info["region"].replace("_", "-")
-    ip = machine_info["ip_address"].replace(".", ".")  # Keep dots for IP
     
-    return f"{date_str}_{region}_{ip}"
+    return f"{date_str}_{region}_{machine_info['ip_address']}"
+
+
+class RequestPacer:
+    """
+    Space out request starts across worker threads.
+    
+    Each caller reserves the next free slot under the lock and sleeps
+    outside it, so waiting workers do not hold each other up and the
+    thread collecting results never sleeps.
+    
+    Example:
+        pacer = RequestPacer(0.1)
+        pacer.wait()  # in each worker, right before the API call
+    """
+    
+    def __init__(self, interval: float):
+        """
+        Initialize pacer.
+        
+        Args:
+            interval: Minimum seconds between request starts (<= 0 disables pacing)
+        """
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """Block until this caller's slot comes up."""
+        if self.interval <= 0:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        
+        if slot > now:
+            time.sleep(slot - now)
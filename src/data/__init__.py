@@ -11,6 +11,7 @@ from .datasets import (
     list_datasets,
     get_dataset_info,
     image_to_base64,
+    prefetch_files,
 )
 
 __all__ = [
@@ -24,4 +25,5 @@ __all__ = [
     "list_datasets",
     "get_dataset_info",
     "image_to_base64",
+    "prefetch_files",
 ]
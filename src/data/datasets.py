@@ -8,14 +8,18 @@ Features:
 - Consistent sampling strategy across all vendors
 """
 
+import os
+import json
 import base64
 import random
+import hashlib
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 
 from .loader import TestCase, ContentType
+from ..config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -146,6 +150,9 @@ class VendorDataLoader:
         self.base_path = Path(base_path)
         self.seed = seed
         
+        # Parsed-case cache, invalidated by source mtime/size
+        self.index_dir = Config.OUTPUT_DIR / "cache" / "datasets" / vendor
+        
         # Set random seed for reproducibility
         random.seed(seed)
         
@@ -254,6 +261,13 @@ class VendorDataLoader:
                 if limit:
                     cases = cases[:limit]
         
+        # Start reading sampled local images into the page cache now, so the
+        # provider calls later find them in memory
+        local_paths = [c.content for c in cases if c.metadata.get("is_local")]
+        if local_paths:
+            prefetched = prefetch_files(local_paths)
+            logger.debug(f"Prefetching {prefetched}/{len(local_paths)} local images")
+        
         logger.info(f"Loaded {len(cases)} image cases for {self.vendor}")
         return cases
     
@@ -436,6 +450,60 @@ class VendorDataLoader:
         
         return self._proportional_sample(dir_cases_list, limit)
     
+    def _index_path(self, source: Path, params: Dict[str, Any]) -> Path:
+        """Path of the cached index for a source file/directory and load parameters."""
+        key = json.dumps([str(source.resolve()), params], ensure_ascii=False, sort_keys=True)
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return self.index_dir / f"{digest}.json"
+    
+    def _read_index(self, source: Path, params: Dict[str, Any]) -> Optional[List[TestCase]]:
+        """
+        Return cached cases for a source, or None if missing or stale.
+        
+        An index is stale when the source's mtime or size has changed. For a
+        directory, adding or removing files updates its mtime.
+        """
+        index_path = self._index_path(source, params)
+        try:
+            st = source.stat()
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if index.get("mtime_ns") != st.st_mtime_ns or index.get("size") != st.st_size:
+            return None
+        
+        return [
+            TestCase(
+                id=row["id"],
+                content=row["content"],
+                content_type=ContentType(row["content_type"]),
+                expected_risk=row["expected_risk"],
+                category=row["category"],
+                metadata=row["metadata"],
+            )
+            for row in index["cases"]
+        ]
+    
+    def _write_index(self, source: Path, params: Dict[str, Any], cases: List[TestCase]) -> None:
+        """Cache parsed cases for a source; failures only cost the speedup."""
+        try:
+            st = source.stat()
+            index_path = self._index_path(source, params)
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = index_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "source": str(source),
+                    "mtime_ns": st.st_mtime_ns,
+                    "size": st.st_size,
+                    "cases": [case.to_dict() for case in cases],
+                }, f, ensure_ascii=False, default=str)
+            tmp_path.replace(index_path)
+        except OSError as e:
+            logger.debug(f"Could not write dataset index for {source}: {e}")
+    
     def _load_excel_cases(
         self,
         file_path: Path,
@@ -446,7 +514,45 @@ class VendorDataLoader:
         default_category: str,
         limit: Optional[int],
     ) -> List[TestCase]:
-        """Load cases from Excel file with column mapping."""
+        """Load cases from Excel file with column mapping, using the index cache."""
+        params = {
+            "sheet": sheet_name,
+            "columns": columns,
+            "content_type": content_type.value,
+            "default_risk": default_risk,
+            "default_category": default_category,
+            "limit": limit,
+        }
+        cases = self._read_index(file_path, params)
+        if cases is not None:
+            logger.info(f"Loaded {len(cases)} cases from {file_path.name} (cached)")
+            return cases
+        
+        cases, complete = self._parse_excel_cases(
+            file_path, sheet_name, columns, content_type,
+            default_risk, default_category, limit,
+        )
+        if complete:
+            self._write_index(file_path, params, cases)
+        
+        return cases
+    
+    def _parse_excel_cases(
+        self,
+        file_path: Path,
+        sheet_name: Optional[str],
+        columns: Dict[str, str],
+        content_type: ContentType,
+        default_risk: str,
+        default_category: str,
+        limit: Optional[int],
+    ) -> tuple:
+        """
+        Parse cases from Excel file with column mapping.
+        
+        Returns:
+            Tuple of (cases, complete); complete is False if parsing failed
+        """
         try:
             import pandas as pd
         except ImportError:
@@ -507,8 +613,9 @@ class VendorDataLoader:
             
         except Exception as e:
             logger.error(f"Error loading {file_path}: {e}")
+            return cases, False
         
-        return cases
+        return cases, True
     
     def _load_local_images(
         self,
@@ -524,6 +631,16 @@ class VendorDataLoader:
             logger.warning(f"Directory not found: {dir_path}")
             return cases
         
+        params = {
+            "default_risk": default_risk,
+            "default_category": default_category,
+            "limit": limit,
+        }
+        cached = self._read_index(dir_path, params)
+        if cached is not None:
+            logger.info(f"Loaded {len(cached)} images from {dir_path.name} (cached)")
+            return cached
+        
         # Supported image extensions
         image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'}
         
@@ -551,6 +668,7 @@ class VendorDataLoader:
             cases.append(case)
         
         logger.info(f"Loaded {len(cases)} images from {dir_path.name}")
+        self._write_index(dir_path, params, cases)
         return cases
 
 
@@ -581,3 +699,35 @@ def image_to_base64(image_path: str) -> Optional[str]:
     except Exception as e:
         logger.error(f"Failed to read image {image_path}: {e}")
         return None
+
+
+def prefetch_files(paths: List[str]) -> int:
+    """
+    Hint the kernel to read files into the page cache in the background.
+    
+    Uses posix_fadvise(POSIX_FADV_WILLNEED), which returns immediately; a
+    no-op on platforms without it.
+    
+    Args:
+        paths: File paths to prefetch
+        
+    Returns:
+        Number of files the hint was issued for
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return 0
+    
+    count = 0
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            count += 1
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return count
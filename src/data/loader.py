@@ -66,9 +66,9 @@ class DataLoader:
         - CSV (.csv)
     
     Example:
-        loader = DataLoader("test_data.xlsx")
-        text_cases = loader.load_text_cases()
-        image_cases = loader.load_image_cases()
+        with DataLoader("test_data.xlsx") as loader:
+            text_cases = loader.load_text_cases()
+            image_cases = loader.load_image_cases()
     """
     
     def __init__(self, file_path: str):
@@ -84,8 +84,26 @@ class DataLoader:
             raise FileNotFoundError(f"Data file not found: {file_path}")
         
         self.format = self._detect_format()
+        
+        # Parsed sources, shared by the text and image loads
+        self._workbook = None
+        self._json_data: Any = None
+        self._csv_rows: Optional[List[Dict[str, str]]] = None
+        
         logger.info(f"DataLoader initialized: {file_path} (format: {self.format})")
     
+    def close(self) -> None:
+        """Release the cached Excel workbook, if one was opened."""
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+    
+    def __enter__(self) -> "DataLoader":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def _detect_format(self) -> str:
         """Detect file format from extension."""
         suffix = self.file_path.suffix.lower()
@@ -156,7 +174,11 @@ class DataLoader:
             raise ImportError("openpyxl is required for Excel files. Install with: pip install openpyxl")
         
         cases = []
-        workbook = openpyxl.load_workbook(self.file_path, read_only=True)
+        
+        # Opening the workbook parses the shared-string table, so do it once
+        if self._workbook is None:
+            self._workbook = openpyxl.load_workbook(self.file_path, read_only=True)
+        workbook = self._workbook
         
         # 定义备选 sheet 名称
         fallback_names = {
@@ -164,56 +186,52 @@ class DataLoader:
             ContentType.IMAGE: ["图片测试题", "Sheet2", "图片", "image", "Image", "图片测试"],
         }
         
-        try:
-            # 尝试找到合适的 sheet
-            sheet = None
-            used_name = sheet_name
-            
-            if sheet_name in workbook.sheetnames:
-                sheet = workbook[sheet_name]
-            else:
-                # 尝试备选名称
-                for name in fallback_names.get(content_type, []):
-                    if name in workbook.sheetnames:
-                        sheet = workbook[name]
-                        used_name = name
-                        logger.info(f"Sheet '{sheet_name}' not found. Using fallback: '{name}'")
-                        break
-                
-                # 如果都没找到，使用第一个 sheet
-                if sheet is None and workbook.sheetnames:
-                    sheet = workbook[workbook.sheetnames[0]]
-                    used_name = workbook.sheetnames[0]
-                    logger.warning(f"Sheet '{sheet_name}' not found. Using first sheet: '{used_name}'")
+        # 尝试找到合适的 sheet
+        sheet = None
+        used_name = sheet_name
+        
+        if sheet_name in workbook.sheetnames:
+            sheet = workbook[sheet_name]
+        else:
+            # 尝试备选名称
+            for name in fallback_names.get(content_type, []):
+                if name in workbook.sheetnames:
+                    sheet = workbook[name]
+                    used_name = name
+                    logger.info(f"Sheet '{sheet_name}' not found. Using fallback: '{name}'")
+                    break
             
-            if sheet is None:
-                logger.error(f"No sheets found in workbook")
-                return cases
+            # 如果都没找到，使用第一个 sheet
+            if sheet is None and workbook.sheetnames:
+                sheet = workbook[workbook.sheetnames[0]]
+                used_name = workbook.sheetnames[0]
+                logger.warning(f"Sheet '{sheet_name}' not found. Using first sheet: '{used_name}'")
+        
+        if sheet is None:
+            logger.error(f"No sheets found in workbook")
+            return cases
+        
+        # Expected columns: 类型(黑/白), 序号, 内容, 预期风险
+        for row_idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=1):
+            if not row or not row[0]:  # Skip empty rows
+                continue
             
-            # Expected columns: 类型(黑/白), 序号, 内容, 预期风险
-            for row_idx, row in enumerate(sheet.iter_rows(min_row=2, values_only=True), start=1):
-                if not row or not row[0]:  # Skip empty rows
-                    continue
-                
-                if limit and len(cases) >= limit:
-                    break
-                
-                case = TestCase(
-                    id=str(row[1]) if len(row) > 1 and row[1] else f"{content_type.value}_{row_idx}",
-                    content=str(row[2]) if len(row) > 2 and row[2] else "",
-                    content_type=content_type,
-                    expected_risk=str(row[3]) if len(row) > 3 and row[3] else "正常",
-                    category=str(row[0]) if row[0] else "",
-                    metadata={"row_number": row_idx + 1},
-                )
-                
-                if case.content:  # Only add cases with content
-                    cases.append(case)
+            if limit and len(cases) >= limit:
+                break
             
-            logger.info(f"Loaded {len(cases)} {content_type.value} cases from Excel")
+            case = TestCase(
+                id=str(row[1]) if len(row) > 1 and row[1] else f"{content_type.value}_{row_idx}",
+                content=str(row[2]) if len(row) > 2 and row[2] else "",
+                content_type=content_type,
+                expected_risk=str(row[3]) if len(row) > 3 and row[3] else "正常",
+                category=str(row[0]) if row[0] else "",
+                metadata={"row_number": row_idx + 1},
+            )
             
-        finally:
-            workbook.close()
+            if case.content:  # Only add cases with content
+                cases.append(case)
+        
+        logger.info(f"Loaded {len(cases)} {content_type.value} cases from Excel")
         
         return cases
     
@@ -225,8 +243,10 @@ class DataLoader:
         """Load test cases from JSON file."""
         cases = []
         
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if self._json_data is None:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                self._json_data = json.load(f)
+        data = self._json_data
         
         # Support both array and object with 'text'/'image' keys
         if isinstance(data, list):
@@ -264,23 +284,24 @@ class DataLoader:
         """Load test cases from CSV file."""
         cases = []
         
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+        if self._csv_rows is None:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                self._csv_rows = list(csv.DictReader(f))
+        
+        for idx, row in enumerate(self._csv_rows):
+            if limit and len(cases) >= limit:
+                break
             
-            for idx, row in enumerate(reader):
-                if limit and len(cases) >= limit:
-                    break
-                
-                case = TestCase(
-                    id=str(row.get("id", row.get("序号", f"{content_type.value}_{idx}"))),
-                    content=str(row.get("content", row.get("内容", ""))),
-                    content_type=content_type,
-                    expected_risk=str(row.get("expected_risk", row.get("预期风险", "正常"))),
-                    category=str(row.get("category", row.get("类型", ""))),
-                )
-                
-                if case.content:
-                    cases.append(case)
+            case = TestCase(
+                id=str(row.get("id", row.get("序号", f"{content_type.value}_{idx}"))),
+                content=str(row.get("content", row.get("内容", ""))),
+                content_type=content_type,
+                expected_risk=str(row.get("expected_risk", row.get("预期风险", "正常"))),
+                category=str(row.get("category", row.get("类型", ""))),
+            )
+            
+            if case.content:
+                cases.append(case)
         
         logger.info(f"Loaded {len(cases)} {content_type.value} cases from CSV")
         return cases
@@ -0,0 +1,131 @@
+"""
+Image payload helpers shared by providers and the benchmark runner.
+Kept free of package imports so providers can use them without loading
+the benchmark layer.
+"""
+
+import base64
+import threading
+import contextlib
+from typing import Dict, Optional
+
+# pybase64 is optional; it is a SIMD-accelerated drop-in for base64
+try:
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
+
+
+# Characters allowed in standard base64 (including padding)
+_BASE64_ALPHABET = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="
+)
+
+
+def is_base64_image(content: str) -> bool:
+    """
+    Check if the content is a base64 encoded image.
+    
+    Args:
+        content: String to check
+        
+    Returns:
+        True if content appears to be base64 image data
+    """
+    if not content or len(content) < 100:
+        return False
+    
+    # Check if it starts with data URI scheme
+    if content.startswith('data:image/'):
+        return True
+    
+    # Check if it looks like raw base64 (no URL-like patterns)
+    if content.startswith(('http://', 'https://', '/')):
+        return False
+    
+    # Sample first 1000 chars for efficiency
+    sample = content[:1000]
+    if not sample.isascii():
+        return False
+    
+    # Drop line breaks and spaces, then check only base64 characters remain
+    sample = sample.encode("ascii").translate(None, b"\r\n ")
+    if not sample or sample.translate(None, _BASE64_ALPHABET):
+        return False
+    
+    # Try to decode a small portion to verify
+    try:
+        # Base64 strings should have length divisible by 4
+        test_len = min(100, len(sample))
+        test_len = test_len - (test_len % 4)
+        base64.b64decode(sample[:test_len])
+        return True
+    except Exception:
+        return False
+
+
+# Encoded images shared between providers inside shared_image_encodings()
+SHARED_IMAGE_CACHE_BYTES = 256 * 1024 * 1024
+
+_image_cache: Optional[Dict[str, str]] = None
+_image_cache_bytes = 0
+_image_cache_lock = threading.Lock()
+
+
+def encode_image_file(path: str) -> str:
+    """
+    Read a local image file and return it BASE64 encoded.
+    
+    Inside a shared_image_encodings() block each file is encoded once and
+    reused by every caller, up to SHARED_IMAGE_CACHE_BYTES of encoded data.
+    
+    Args:
+        path: Path to the image file
+        
+    Returns:
+        BASE64 encoded image data
+        
+    Raises:
+        OSError: If the file cannot be read
+    """
+    global _image_cache_bytes
+    
+    cache = _image_cache
+    if cache is not None:
+        encoded = cache.get(path)
+        if encoded is not None:
+            return encoded
+    
+    with open(path, "rb") as f:
+        encoded = _b64.b64encode(f.read()).decode("ascii")
+    
+    if cache is not None:
+        with _image_cache_lock:
+            if _image_cache_bytes + len(encoded) <= SHARED_IMAGE_CACHE_BYTES:
+                cache[path] = encoded
+                _image_cache_bytes += len(encoded)
+    
+    return encoded
+
+
+@contextlib.contextmanager
+def shared_image_encodings():
+    """
+    Reuse encode_image_file() results for the duration of the block.
+    
+    Used when several providers are sent the same local images, so each
+    file is read and encoded once rather than once per provider.
+    """
+    global _image_cache, _image_cache_bytes
+    
+    if _image_cache is not None:
+        # Nested use shares the outer cache
+        yield
+        return
+    
+    _image_cache = {}
+    try:
+        yield
+    finally:
+        _image_cache = None
+        _image_cache_bytes = 0
@@ -0,0 +1,30 @@
+"""
+Logging helpers shared by the CLI entry points.
+Kept free of heavy imports so they can be used at module load.
+"""
+
+import logging
+import time
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders the asctime prefix once per second.
+    
+    The default formatTime() calls localtime() and strftime() for every
+    record, which dominates when --debug logs every request. Output is
+    identical to logging.Formatter's default "YYYY-MM-DD HH:MM:SS,mmm".
+    """
+    
+    _cached = (None, "")
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, prefix = self._cached
+        if cached_second != second:
+            prefix = time.strftime(self.default_time_format, self.converter(second))
+            self._cached = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
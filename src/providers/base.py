@@ -6,9 +6,15 @@ All providers must implement this interface.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import os
 import time
 
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..config import Config
+
 
 class ContentType(Enum):
     """Types of content that can be moderated."""
@@ -90,10 +96,60 @@ class BaseProvider(ABC):
     # Supported content types
     supported_types: List[ContentType] = [ContentType.TEXT, ContentType.IMAGE]
     
+    # Environment variables that must be set for the provider to work
+    required_env_vars: Tuple[str, ...] = ()
+    
     def __init__(self):
         """Initialize provider with configuration."""
         self.config = self._load_config()
         self._validate_config()
+        
+        # One session per provider so concurrent requests reuse keep-alive
+        # connections instead of paying a TCP/TLS handshake per call
+        self.session = requests.Session()
+        self.pool_size = 0
+        self.set_pool_size(Config.MAX_WORKERS)
+    
+    def set_pool_size(self, size: int) -> None:
+        """
+        Size the HTTP connection pool for the expected concurrency.
+        
+        Args:
+            size: Maximum number of pooled connections per host
+        """
+        if size == self.pool_size:
+            return
+        
+        self.pool_size = size
+        adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+        old_adapters = {self.session.adapters.get(prefix) for prefix in ("http://", "https://")}
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Release the replaced pools' idle connections
+        for old in old_adapters:
+            if old is not None:
+                old.close()
+    
+    def warmup(self) -> None:
+        """
+        Do one-time setup ahead of the first measured request.
+        
+        Providers that build SDK clients lazily override this so that
+        client construction is not charged to the first request's
+        response time. Must not contact the API.
+        """
+        pass
+    
+    @classmethod
+    def is_configured(cls) -> bool:
+        """
+        Check whether the provider's credentials are present.
+        
+        Only looks at environment variables (including those loaded from
+        .env); does not instantiate the provider or contact the API.
+        """
+        return all(os.getenv(var) for var in cls.required_env_vars)
     
     @abstractmethod
     def _load_config(self) -> Dict[str, Any]:
@@ -9,6 +9,7 @@ import time
 import json
 import base64
 import logging
+import threading
 from typing import Dict, Any, List
 
 from .base import (
@@ -20,7 +21,7 @@ from .base import (
     APIError,
 )
 from ..config import Config
-from ..benchmark.utils import is_base64_image
+from ..imaging import is_base64_image, encode_image_file
 
 logger = logging.getLogger(__name__)
 
@@ -179,6 +180,7 @@ class HuoshanProvider(BaseProvider):
     
     name = "huoshan"
     display_name = "火山引擎"
+    required_env_vars = ("HUOSHAN_ACCESS_KEY", "HUOSHAN_SECRET_KEY", "HUOSHAN_APP_ID")
     
     # Decision type mapping
     DECISION_MAPPING = {
@@ -187,6 +189,17 @@ class HuoshanProvider(BaseProvider):
         5: ("REVIEW", "安全代答"),
     }
     
+    def __init__(self):
+        """Initialize provider; the SDK client is created on first use."""
+        self._client = None
+        self._client_lock = threading.Lock()
+        super().__init__()
+    
+    @classmethod
+    def is_configured(cls) -> bool:
+        """Credentials must be set and the bundled SDK importable."""
+        return HAS_VOLCENGINE_SDK and super().is_configured()
+    
     def _load_config(self) -> Dict[str, Any]:
         """Load Huoshan configuration from environment."""
         return Config.get_huoshan_config()
@@ -211,8 +224,32 @@ class HuoshanProvider(BaseProvider):
                 "Please set it in your .env file."
             )
     
+    def set_pool_size(self, size: int) -> None:
+        """Size the connection pools of the session and the SDK client."""
+        super().set_pool_size(size)
+        if self._client is not None:
+            self._client.SetConnMax(size)
+    
+    def warmup(self) -> None:
+        """Create the SDK client before the benchmark starts timing."""
+        if HAS_VOLCENGINE_SDK:
+            self._get_client()
+    
     def _get_client(self):
-        """Create and return LLM Shield client."""
+        """
+        Return the shared LLM Shield client, creating it on first use.
+        
+        The client holds a requests.Session, so reusing it keeps connections
+        alive across calls. It carries no per-request state.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+    
+    def _create_client(self):
+        """Create LLM Shield client."""
         if not HAS_VOLCENGINE_SDK:
             raise ConfigurationError(
                 "volcenginesdkllmshield SDK is not available."
@@ -228,13 +265,15 @@ class HuoshanProvider(BaseProvider):
         
         timeout = Config.REQUEST_TIMEOUT
         
-        return ClientV2(
+        client = ClientV2(
             url,
             self.config["access_key"],
             self.config["secret_key"],
             region,
             timeout
         )
+        client.SetConnMax(self.pool_size)
+        return client
     
     def moderate_text(self, text: str, **kwargs) -> ModerationResult:
         """
@@ -259,15 +298,16 @@ class HuoshanProvider(BaseProvider):
         
         for attempt in range(retry_times):
             try:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Log request
-                logger.debug(f"\n{'='*60}")
-                logger.debug(f">>> HUOSHAN TEXT API REQUEST")
-                logger.debug(f"{'='*60}")
-                logger.debug(f"AppID: {self.config['app_id']}")
-                logger.debug(f"Role: {role}")
-                logger.debug(f"Content: {text[:100]}...")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"\n{'='*60}")
+                    logger.debug(f">>> HUOSHAN TEXT API REQUEST")
+                    logger.debug(f"{'='*60}")
+                    logger.debug(f"AppID: {self.config['app_id']}")
+                    logger.debug(f"Role: {role}")
+                    logger.debug(f"Content: {text[:100]}...")
                 
                 # Create client and request
                 client = self._get_client()
@@ -283,7 +323,7 @@ class HuoshanProvider(BaseProvider):
                 # Make API call
                 response = client.Moderate(request)
                 
-                result.response_time = time.time() - start_time
+                result.response_time = time.perf_counter() - start_time
                 result.success = True
                 
                 # Parse response
@@ -291,11 +331,12 @@ class HuoshanProvider(BaseProvider):
                 result.raw_response = raw_response
                 
                 # Log response
-                logger.debug(f"\n{'='*60}")
-                logger.debug(f"<<< HUOSHAN TEXT API RESPONSE")
-                logger.debug(f"{'='*60}")
-                logger.debug(f"Response Time: {result.response_time*1000:.0f}ms")
-                logger.debug(f"Full Response:\n{json.dumps(raw_response, ensure_ascii=False, indent=2)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"\n{'='*60}")
+                    logger.debug(f"<<< HUOSHAN TEXT API RESPONSE")
+                    logger.debug(f"{'='*60}")
+                    logger.debug(f"Response Time: {result.response_time*1000:.0f}ms")
+                    logger.debug(f"Full Response:\n{json.dumps(raw_response, ensure_ascii=False, indent=2)}")
                 
                 # Parse result using common_tools logic
                 parsed = parse_moderate_result(raw_response)
@@ -351,7 +392,7 @@ class HuoshanProvider(BaseProvider):
         
         for attempt in range(retry_times):
             try:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Get image as BASE64
                 if is_base64_image(image_url):
@@ -359,26 +400,25 @@ class HuoshanProvider(BaseProvider):
                     image_base64 = image_url
                 elif image_url.startswith(('http://', 'https://')):
                     # Download and convert to BASE64
-                    import requests
-                    response = requests.get(image_url, timeout=30)
+                    response = self.session.get(image_url, timeout=30)
                     response.raise_for_status()
                     image_base64 = base64.b64encode(response.content).decode('utf-8')
                 elif os.path.isfile(image_url):
                     # Local file - read and convert to BASE64
-                    with open(image_url, 'rb') as f:
-                        image_base64 = base64.b64encode(f.read()).decode('utf-8')
+                    image_base64 = encode_image_file(image_url)
                 else:
                     result.error = f"Invalid image source: {image_url[:50]}..."
                     result.success = False
                     return result
                 
                 # Log request
-                logger.debug(f"\n{'='*60}")
-                logger.debug(f">>> HUOSHAN IMAGE API REQUEST")
-                logger.debug(f"{'='*60}")
-                logger.debug(f"AppID: {self.config['app_id']}")
-                logger.debug(f"Role: {role}")
-                logger.debug(f"Image BASE64 length: {len(image_base64)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"\n{'='*60}")
+                    logger.debug(f">>> HUOSHAN IMAGE API REQUEST")
+                    logger.debug(f"{'='*60}")
+                    logger.debug(f"AppID: {self.config['app_id']}")
+                    logger.debug(f"Role: {role}")
+                    logger.debug(f"Image BASE64 length: {len(image_base64)}")
                 
                 # Create client and request
                 client = self._get_client()
@@ -394,7 +434,7 @@ class HuoshanProvider(BaseProvider):
                 # Make API call
                 response = client.Moderate(request)
                 
-                result.response_time = time.time() - start_time
+                result.response_time = time.perf_counter() - start_time
                 result.success = True
                 
                 # Parse response
@@ -402,11 +442,12 @@ class HuoshanProvider(BaseProvider):
                 result.raw_response = raw_response
                 
                 # Log response (hide base64 data)
-                logger.debug(f"\n{'='*60}")
-                logger.debug(f"<<< HUOSHAN IMAGE API RESPONSE")
-                logger.debug(f"{'='*60}")
-                logger.debug(f"Response Time: {result.response_time*1000:.0f}ms")
-                logger.debug(f"Full Response:\n{json.dumps(raw_response, ensure_ascii=False, indent=2)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"\n{'='*60}")
+                    logger.debug(f"<<< HUOSHAN IMAGE API RESPONSE")
+                    logger.debug(f"{'='*60}")
+                    logger.debug(f"Response Time: {result.response_time*1000:.0f}ms")
+                    logger.debug(f"Full Response:\n{json.dumps(raw_response, ensure_ascii=False, indent=2)}")
                 
                 # Parse result using common_tools logic
                 parsed = parse_moderate_result(raw_response)
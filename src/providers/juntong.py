@@ -3,6 +3,7 @@ JunTong (君同未来) content moderation provider implementation.
 API Documentation: 内部文档
 """
 
+import os
 import time
 import json
 import logging
@@ -18,6 +19,7 @@ from .base import (
     APIError,
 )
 from ..config import Config
+from ..imaging import encode_image_file
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +39,7 @@ class JunTongProvider(BaseProvider):
     
     name = "juntong"
     display_name = "君同未来"
+    required_env_vars = ("JUNTONG_TEXT_API_KEY", "JUNTONG_IMAGE_API_KEY")
     
     # API endpoints
     TEXT_ENDPOINT = "/api/v1/shield/conversation/detect"
@@ -46,6 +49,11 @@ class JunTongProvider(BaseProvider):
         """Load JunTong configuration from environment."""
         return Config.get_juntong_config()
     
+    @classmethod
+    def is_configured(cls) -> bool:
+        """Either the text or the image API key is enough."""
+        return any(os.getenv(var) for var in cls.required_env_vars)
+    
     def _validate_config(self) -> None:
         """Validate JunTong configuration."""
         if not self.config.get("text_api_key") and not self.config.get("image_api_key"):
@@ -105,7 +113,6 @@ class JunTongProvider(BaseProvider):
             }
         else:
             # Local file - convert to Base64
-            import base64
             from pathlib import Path
             
             img_path = Path(image_url)
@@ -119,9 +126,7 @@ class JunTongProvider(BaseProvider):
                 return result
             
             try:
-                with open(img_path, 'rb') as img_file:
-                    img_data = img_file.read()
-                    img_base64 = base64.b64encode(img_data).decode('utf-8')
+                img_base64 = encode_image_file(image_url)
             except Exception as e:
                 result = ModerationResult(
                     provider=self.name,
@@ -181,30 +186,31 @@ class JunTongProvider(BaseProvider):
         
         for attempt in range(retry_times):
             try:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Log request details at DEBUG level (hide base64 content)
-                logger.debug(f"\n{'='*60}")
-                logger.debug(f">>> API REQUEST")
-                logger.debug(f"{'='*60}")
-                logger.debug(f"URL: {url}")
-                logger.debug(f"Content Type: {content_type.value}")
-                
-                # Create a sanitized payload for logging (hide base64)
-                log_payload = payload.copy()
-                if log_payload.get("upload_type") == "BASE64" and "image" in log_payload:
-                    img_len = len(log_payload["image"])
-                    log_payload["image"] = f"[BASE64 DATA: {img_len} chars]"
-                logger.debug(f"Payload:\n{json.dumps(log_payload, ensure_ascii=False, indent=2)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"\n{'='*60}")
+                    logger.debug(f">>> API REQUEST")
+                    logger.debug(f"{'='*60}")
+                    logger.debug(f"URL: {url}")
+                    logger.debug(f"Content Type: {content_type.value}")
+                    
+                    # Create a sanitized payload for logging (hide base64)
+                    log_payload = payload.copy()
+                    if log_payload.get("upload_type") == "BASE64" and "image" in log_payload:
+                        img_len = len(log_payload["image"])
+                        log_payload["image"] = f"[BASE64 DATA: {img_len} chars]"
+                    logger.debug(f"Payload:\n{json.dumps(log_payload, ensure_ascii=False, indent=2)}")
                 
-                response = requests.post(
+                response = self.session.post(
                     url,
                     json=payload,
                     headers=headers,
                     timeout=timeout,
                 )
                 
-                result.response_time = time.time() - start_time
+                result.response_time = time.perf_counter() - start_time
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -212,11 +218,12 @@ class JunTongProvider(BaseProvider):
                     result.success = True
                     
                     # Log response details at DEBUG level
-                    logger.debug(f"\n{'='*60}")
-                    logger.debug(f"<<< API RESPONSE")
-                    logger.debug(f"{'='*60}")
-                    logger.debug(f"Response Time: {result.response_time*1000:.0f}ms")
-                    logger.debug(f"Full Response:\n{json.dumps(data, ensure_ascii=False, indent=2)}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"\n{'='*60}")
+                        logger.debug(f"<<< API RESPONSE")
+                        logger.debug(f"{'='*60}")
+                        logger.debug(f"Response Time: {result.response_time*1000:.0f}ms")
+                        logger.debug(f"Full Response:\n{json.dumps(data, ensure_ascii=False, indent=2)}")
                     
                     # Parse response based on content type
                     if data.get("code") == 0:  # Success
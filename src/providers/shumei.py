@@ -5,7 +5,6 @@ API Documentation: https://www.ishumei.com/help/documents.html
 
 import time
 import json
-import base64
 import logging
 import requests
 from pathlib import Path
@@ -20,6 +19,7 @@ from .base import (
     APIError,
 )
 from ..config import Config, RISK_LABEL_MAPPING
+from ..imaging import encode_image_file
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +41,7 @@ class ShumeiProvider(BaseProvider):
     
     name = "shumei"
     display_name = "数美科技"
+    required_env_vars = ("SHUMEI_ACCESS_KEY",)
     
     # Default event IDs
     TEXT_EVENT_ID = "input"   # User input content
@@ -147,11 +148,9 @@ class ShumeiProvider(BaseProvider):
         path = Path(image_source)
         if path.exists() and path.is_file():
             try:
-                with open(path, 'rb') as f:
-                    img_bytes = f.read()
-                    img_base64 = base64.b64encode(img_bytes).decode('utf-8')
-                    logger.debug(f"Converted local image to BASE64: {path.name} ({len(img_bytes)} bytes)")
-                    return img_base64
+                img_base64 = encode_image_file(image_source)
+                logger.debug(f"Converted local image to BASE64: {path.name} ({len(img_base64)} chars)")
+                return img_base64
             except Exception as e:
                 logger.error(f"Failed to read local image {image_source}: {e}")
                 # Fall back to treating it as URL
@@ -187,39 +186,40 @@ class ShumeiProvider(BaseProvider):
         
         for attempt in range(retry_times):
             try:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Log request details at DEBUG level
-                logger.debug(f"\n{'='*60}")
-                logger.debug(f">>> API REQUEST")
-                logger.debug(f"{'='*60}")
-                logger.debug(f"URL: {url}")
-                logger.debug(f"Content Type: {content_type.value}")
-                # Don't log accessKey and BASE64 data for security/readability
-                safe_payload = {}
-                for k, v in payload.items():
-                    if k == 'accessKey':
-                        safe_payload[k] = '***HIDDEN***'
-                    elif k == 'data' and isinstance(v, dict):
-                        safe_data = {}
-                        for dk, dv in v.items():
-                            if dk == 'img' and isinstance(dv, str) and len(dv) > 200 and not dv.startswith('http'):
-                                safe_data[dk] = f"[BASE64 DATA - {len(dv)} chars]"
-                            else:
-                                safe_data[dk] = dv
-                        safe_payload[k] = safe_data
-                    else:
-                        safe_payload[k] = v
-                logger.debug(f"Payload:\n{json.dumps(safe_payload, ensure_ascii=False, indent=2)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"\n{'='*60}")
+                    logger.debug(f">>> API REQUEST")
+                    logger.debug(f"{'='*60}")
+                    logger.debug(f"URL: {url}")
+                    logger.debug(f"Content Type: {content_type.value}")
+                    # Don't log accessKey and BASE64 data for security/readability
+                    safe_payload = {}
+                    for k, v in payload.items():
+                        if k == 'accessKey':
+                            safe_payload[k] = '***HIDDEN***'
+                        elif k == 'data' and isinstance(v, dict):
+                            safe_data = {}
+                            for dk, dv in v.items():
+                                if dk == 'img' and isinstance(dv, str) and len(dv) > 200 and not dv.startswith('http'):
+                                    safe_data[dk] = f"[BASE64 DATA - {len(dv)} chars]"
+                                else:
+                                    safe_data[dk] = dv
+                            safe_payload[k] = safe_data
+                        else:
+                            safe_payload[k] = v
+                    logger.debug(f"Payload:\n{json.dumps(safe_payload, ensure_ascii=False, indent=2)}")
                 
-                response = requests.post(
+                response = self.session.post(
                     url,
                     json=payload,
                     headers={"Content-Type": "application/json"},
                     timeout=timeout,
                 )
                 
-                result.response_time = time.time() - start_time
+                result.response_time = time.perf_counter() - start_time
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -227,14 +227,15 @@ class ShumeiProvider(BaseProvider):
                     result.success = True
                     
                     # Log response details at DEBUG level
-                    logger.debug(f"\n{'='*60}")
-                    logger.debug(f"<<< API RESPONSE")
-                    logger.debug(f"{'='*60}")
-                    logger.debug(f"Response Time: {result.response_time*1000:.0f}ms")
-                    logger.debug(f"Risk Level: {data.get('riskLevel', 'N/A')}")
-                    logger.debug(f"Risk Label: {data.get('riskLabel1', 'N/A')}")
-                    logger.debug(f"Risk Description: {data.get('riskDescription', 'N/A')}")
-                    logger.debug(f"Full Response:\n{json.dumps(data, ensure_ascii=False, indent=2)}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"\n{'='*60}")
+                        logger.debug(f"<<< API RESPONSE")
+                        logger.debug(f"{'='*60}")
+                        logger.debug(f"Response Time: {result.response_time*1000:.0f}ms")
+                        logger.debug(f"Risk Level: {data.get('riskLevel', 'N/A')}")
+                        logger.debug(f"Risk Label: {data.get('riskLabel1', 'N/A')}")
+                        logger.debug(f"Risk Description: {data.get('riskDescription', 'N/A')}")
+                        logger.debug(f"Full Response:\n{json.dumps(data, ensure_ascii=False, indent=2)}")
                     
                     # Parse response
                     if data.get("code") == 1100:  # Success
@@ -6,7 +6,6 @@ API Documentation: https://support.dun.163.com/documents/588434200783982592
 import time
 import json
 import hashlib
-import base64
 import logging
 import requests
 import uuid
@@ -22,6 +21,7 @@ from .base import (
     APIError,
 )
 from ..config import Config
+from ..imaging import encode_image_file
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +43,7 @@ class YidunProvider(BaseProvider):
     
     name = "yidun"
     display_name = "网易易盾"
+    required_env_vars = ("YIDUN_SECRET_ID", "YIDUN_SECRET_KEY")
     
     # API endpoints
     TEXT_URL = "http://as.dun.163.com/v5/text/check"
@@ -86,16 +87,10 @@ class YidunProvider(BaseProvider):
         3. Append secret_key
         4. MD5 hash
         """
-        # Sort by key
-        sorted_keys = sorted(params.keys())
-        
-        # Concatenate
-        param_str = ""
-        for key in sorted_keys:
-            param_str += str(key) + str(params[key])
-        
-        # Append secret key
-        param_str += self.config["secret_key"]
+        # Sort by key, concatenate key+value pairs and append secret key
+        param_str = "".join(
+            f"{key}{params[key]}" for key in sorted(params)
+        ) + self.config["secret_key"]
         
         # MD5 hash
         return hashlib.md5(param_str.encode("utf-8")).hexdigest()
@@ -182,11 +177,9 @@ class YidunProvider(BaseProvider):
         path = Path(image_source)
         if path.exists() and path.is_file():
             try:
-                with open(path, 'rb') as f:
-                    img_bytes = f.read()
-                    img_base64 = base64.b64encode(img_bytes).decode('utf-8')
-                    logger.debug(f"Converted local image to BASE64: {path.name} ({len(img_bytes)} bytes)")
-                    return (2, img_base64)
+                img_base64 = encode_image_file(image_source)
+                logger.debug(f"Converted local image to BASE64: {path.name} ({len(img_base64)} chars)")
+                return (2, img_base64)
             except Exception as e:
                 logger.error(f"Failed to read local image {image_source}: {e}")
                 # Fall back to treating it as URL
@@ -218,50 +211,52 @@ class YidunProvider(BaseProvider):
         
         for attempt in range(retry_times):
             try:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Log request at DEBUG level
-                logger.debug(f"\n{'='*60}")
-                logger.debug(f">>> API REQUEST")
-                logger.debug(f"{'='*60}")
-                logger.debug(f"URL: {url}")
-                logger.debug(f"Content Type: {content_type.value}")
-                logger.debug(f"DataId: {params.get('dataId')}")
-                # Log images info without BASE64 data
-                if 'images' in params:
-                    try:
-                        images_data = json.loads(params['images'])
-                        safe_images = []
-                        for img in images_data:
-                            safe_img = {k: v for k, v in img.items() if k != 'data'}
-                            if img.get('type') == 2:  # BASE64
-                                safe_img['data'] = f"[BASE64 DATA - {len(img.get('data', ''))} chars]"
-                            else:
-                                safe_img['data'] = img.get('data', '')[:100] + '...' if len(img.get('data', '')) > 100 else img.get('data', '')
-                            safe_images.append(safe_img)
-                        logger.debug(f"Images: {json.dumps(safe_images, ensure_ascii=False)}")
-                    except:
-                        logger.debug(f"Images: [parse error]")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"\n{'='*60}")
+                    logger.debug(f">>> API REQUEST")
+                    logger.debug(f"{'='*60}")
+                    logger.debug(f"URL: {url}")
+                    logger.debug(f"Content Type: {content_type.value}")
+                    logger.debug(f"DataId: {params.get('dataId')}")
+                    # Log images info without BASE64 data
+                    if 'images' in params:
+                        try:
+                            images_data = json.loads(params['images'])
+                            safe_images = []
+                            for img in images_data:
+                                safe_img = {k: v for k, v in img.items() if k != 'data'}
+                                if img.get('type') == 2:  # BASE64
+                                    safe_img['data'] = f"[BASE64 DATA - {len(img.get('data', ''))} chars]"
+                                else:
+                                    safe_img['data'] = img.get('data', '')[:100] + '...' if len(img.get('data', '')) > 100 else img.get('data', '')
+                                safe_images.append(safe_img)
+                            logger.debug(f"Images: {json.dumps(safe_images, ensure_ascii=False)}")
+                        except:
+                            logger.debug(f"Images: [parse error]")
                 
-                response = requests.post(
+                response = self.session.post(
                     url,
                     data=params,
                     headers=headers,
                     timeout=timeout,
                 )
                 
-                result.response_time = time.time() - start_time
+                result.response_time = time.perf_counter() - start_time
                 
                 if response.status_code == 200:
                     data = response.json()
                     result.raw_response = data
                     
                     # Log response at DEBUG level
-                    logger.debug(f"\n{'='*60}")
-                    logger.debug(f"<<< API RESPONSE")
-                    logger.debug(f"{'='*60}")
-                    logger.debug(f"Response Time: {result.response_time*1000:.0f}ms")
-                    logger.debug(f"Full Response:\n{json.dumps(data, ensure_ascii=False, indent=2)}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"\n{'='*60}")
+                        logger.debug(f"<<< API RESPONSE")
+                        logger.debug(f"{'='*60}")
+                        logger.debug(f"Response Time: {result.response_time*1000:.0f}ms")
+                        logger.debug(f"Full Response:\n{json.dumps(data, ensure_ascii=False, indent=2)}")
                     
                     if data.get("code") == 200:
                         result.success = True
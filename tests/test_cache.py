@@ -0,0 +1,161 @@
+"""Tests for the on-disk response cache."""
+
+import pytest
+
+from src.config import Config
+from src.benchmark.cache import ResponseCache
+from src.benchmark.runner import BenchmarkRunner, BenchmarkConfig
+from src.data.loader import TestCase as Case, ContentType as DataContentType
+from src.providers.base import BaseProvider, ContentType, ModerationResult, RiskLevel
+
+
+class CountingProvider(BaseProvider):
+    """Provider that flags everything and counts API calls."""
+    name = "counting"
+    display_name = "Counting"
+
+    def __init__(self, label: str = "色情"):
+        super().__init__()
+        self.label = label
+        self.calls = 0
+
+    def _load_config(self):
+        return {}
+
+    def moderate_text(self, text, **kwargs):
+        self.calls += 1
+        return ModerationResult(
+            success=True,
+            risk_level=RiskLevel.REJECT,
+            risk_label=self.label,
+            risk_labels=[self.label],
+            response_time=0.25,
+            provider=self.name,
+            content_type=ContentType.TEXT,
+        )
+
+    def moderate_image(self, image_url, **kwargs):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def output_dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "OUTPUT_DIR", tmp_path / "output")
+    monkeypatch.setattr(Config, "REPORT_DIR", tmp_path / "reports")
+
+
+def test_round_trip_keeps_result_and_latency(cache):
+    result = ModerationResult(
+        success=True,
+        risk_level=RiskLevel.REVIEW,
+        risk_label="涉政",
+        risk_labels=["涉政", "广告"],
+        confidence=0.87,
+        response_time=1.234,
+        raw_response={"code": 1100, "detail": {"score": 0.87}},
+    )
+    cache.put("shumei", ContentType.TEXT, "some text", result)
+
+    cached = cache.get("shumei", ContentType.TEXT, "some text")
+
+    assert cached is not None
+    assert cached.success
+    assert cached.risk_level == RiskLevel.REVIEW
+    assert cached.risk_label == "涉政"
+    assert cached.risk_labels == ["涉政", "广告"]
+    assert cached.confidence == 0.87
+    assert cached.response_time == 1.234
+    assert cached.raw_response == {"code": 1100, "detail": {"score": 0.87}}
+    assert cached.provider == "shumei"
+    assert cached.content_type == ContentType.TEXT
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_keys_separate_provider_and_content_type(cache):
+    cache.put("shumei", ContentType.TEXT, "x", ModerationResult(success=True))
+
+    assert cache.get("yidun", ContentType.TEXT, "x") is None
+    assert cache.get("shumei", ContentType.IMAGE, "x") is None
+    assert cache.get("shumei", ContentType.TEXT, "y") is None
+    assert (cache.hits, cache.misses) == (0, 3)
+
+
+def test_failed_results_are_not_cached(cache):
+    cache.put("shumei", ContentType.TEXT, "x", ModerationResult(success=False, error="timeout"))
+
+    assert cache.get("shumei", ContentType.TEXT, "x") is None
+
+
+def test_put_replaces_existing_entry(cache):
+    cache.put("shumei", ContentType.TEXT, "x", ModerationResult(success=True, risk_label="正常"))
+    cache.put("shumei", ContentType.TEXT, "x", ModerationResult(success=True, risk_label="色情"))
+
+    assert cache.get("shumei", ContentType.TEXT, "x").risk_label == "色情"
+
+
+def test_uses_write_ahead_log(cache):
+    assert cache._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_database_errors_do_not_propagate(cache):
+    cache.put("shumei", ContentType.TEXT, "x", ModerationResult(success=True))
+    cache._conn.close()
+
+    cache.put("shumei", ContentType.TEXT, "y", ModerationResult(success=True))
+    assert cache.get("shumei", ContentType.TEXT, "x") is None
+    assert cache.misses == 1
+
+
+def test_runner_reuses_and_refreshes_cache(output_dirs):
+    cases = [Case(id=str(i), content=f"text {i}", content_type=DataContentType.TEXT) for i in range(5)]
+
+    def run(provider, **config):
+        runner = BenchmarkRunner(provider, BenchmarkConfig(max_workers=1, request_interval=0, **config))
+        result = runner.run(text_cases=cases, test_image=False)
+        assert runner.cache is None
+        return result
+
+    first = CountingProvider("色情")
+    run(first, use_cache=True)
+    assert first.calls == 5
+
+    # Cache hits skip the provider and replay the recorded latency
+    cached = CountingProvider("涉政")
+    result = run(cached, use_cache=True)
+    assert cached.calls == 0
+    assert result.text_metrics.avg_response_time == pytest.approx(0.25)
+    assert result.text_metrics.true_negative == 0
+
+    # Refresh ignores cached entries but stores the fresh results
+    refreshed = CountingProvider("正常")
+    run(refreshed, refresh_cache=True)
+    assert refreshed.calls == 5
+
+    after = CountingProvider("涉政")
+    result = run(after, use_cache=True)
+    assert after.calls == 0
+    assert result.text_metrics.true_negative == 5
+
+
+def test_local_image_key_tracks_file_changes(cache, tmp_path):
+    image = tmp_path / "a.jpg"
+    image.write_bytes(b"first image")
+    cache.put("shumei", ContentType.IMAGE, str(image), ModerationResult(success=True, risk_label="色情"))
+    assert cache.get("shumei", ContentType.IMAGE, str(image)).risk_label == "色情"
+
+    # Replaced in place under the same name
+    image.write_bytes(b"a different image")
+    assert cache.get("shumei", ContentType.IMAGE, str(image)) is None
+
+
+def test_remote_image_round_trip(cache):
+    url = "https://example.com/a.jpg"
+    cache.put("shumei", ContentType.IMAGE, url, ModerationResult(success=True))
+    assert cache.get("shumei", ContentType.IMAGE, url) is not None
@@ -0,0 +1,96 @@
+"""Tests for the parsed-dataset index cache."""
+
+import os
+
+import pytest
+
+from src.data.datasets import VendorDataLoader
+from src.data.loader import TestCase as Case, ContentType
+
+PARAMS = {"sheet": None, "limit": None}
+
+
+@pytest.fixture
+def loader(tmp_path):
+    loader = VendorDataLoader("shumei", base_path=str(tmp_path))
+    loader.index_dir = tmp_path / "index"
+    return loader
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "cases.xlsx"
+    path.write_bytes(b"original contents")
+    return path
+
+
+def make_cases():
+    return [
+        Case(id="1", content="你好", content_type=ContentType.TEXT, category="白样本"),
+        Case(
+            id="2",
+            content="bad",
+            content_type=ContentType.TEXT,
+            expected_risk="涉政",
+            category="黑样本",
+            metadata={"row_index": 2},
+        ),
+    ]
+
+
+def test_index_round_trip(loader, source):
+    loader._write_index(source, PARAMS, make_cases())
+
+    assert loader._read_index(source, PARAMS) == make_cases()
+
+
+def test_missing_index(loader, source):
+    assert loader._read_index(source, PARAMS) is None
+
+
+def test_index_is_per_parameter_set(loader, source):
+    loader._write_index(source, PARAMS, make_cases())
+
+    assert loader._read_index(source, {**PARAMS, "limit": 10}) is None
+
+
+def test_mtime_change_invalidates_index(loader, source):
+    loader._write_index(source, PARAMS, make_cases())
+    st = source.stat()
+
+    # Same size, different mtime
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert loader._read_index(source, PARAMS) is None
+
+
+def test_size_change_invalidates_index(loader, source):
+    loader._write_index(source, PARAMS, make_cases())
+    st = source.stat()
+
+    # Different size, same mtime
+    source.write_bytes(b"original contents, edited")
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert loader._read_index(source, PARAMS) is None
+
+
+def test_excel_cases_parsed_once(loader, source, monkeypatch):
+    calls = []
+
+    def parse(*args):
+        calls.append(args)
+        return make_cases(), True
+
+    monkeypatch.setattr(loader, "_parse_excel_cases", parse)
+
+    def load():
+        return loader._load_excel_cases(source, None, {}, ContentType.TEXT, "正常", "", None)
+
+    assert load() == make_cases()
+    assert load() == make_cases()
+    assert len(calls) == 1
+
+    source.write_bytes(b"new contents")
+    assert load() == make_cases()
+    assert len(calls) == 2
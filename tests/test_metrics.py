@@ -0,0 +1,119 @@
+"""Parity checks for MetricsCollector against the straightforward formulas."""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.benchmark.metrics import MetricsCollector, SAFE_LABEL
+from src.providers.base import ModerationResult
+
+LABELS = [SAFE_LABEL, "色情", "涉政", "广告", "涉政-敏感人物"]
+
+
+def nearest_rank(sorted_data, percentile):
+    """Reference percentile: sorted_data[int(n * p / 100)], clamped."""
+    if not sorted_data:
+        return 0.0
+    n = len(sorted_data)
+    return sorted_data[min(int(n * percentile / 100), n - 1)]
+
+
+def labels_match(expected, actual):
+    """Reference label match: exact, or two risky labels that contain each other."""
+    if expected == actual:
+        return True
+    if expected != SAFE_LABEL and actual != SAFE_LABEL:
+        return expected in actual or actual in expected
+    return False
+
+
+def make_records(n, seed):
+    rng = random.Random(seed)
+    records = []
+    for _ in range(n):
+        success = rng.random() > 0.1
+        result = ModerationResult(
+            success=success,
+            error=None if success else rng.choice(["Request timeout", "HTTP 502", "boom"]),
+            risk_label=rng.choice(LABELS),
+            response_time=rng.lognormvariate(-1.5, 0.6),
+        )
+        records.append((result, rng.choice(LABELS), rng.choice(["", "黑样本", "白样本"])))
+    return records
+
+
+@pytest.mark.parametrize("n", [1, 2, 7, 100, 1001])
+def test_percentiles_match_nearest_rank(n):
+    rng = random.Random(n)
+    data = [rng.uniform(0, 5) for _ in range(n)]
+    ranks = (0, 1, 50, 95, 99, 100)
+
+    got = MetricsCollector("p", "text")._percentiles(np.asarray(data), ranks)
+
+    assert got == [nearest_rank(sorted(data), p) for p in ranks]
+
+
+def test_percentiles_of_empty_data():
+    assert MetricsCollector("p", "text")._percentiles(np.asarray([]), (50, 95)) == [0.0, 0.0]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_calculate_matches_reference(seed):
+    records = make_records(500, seed)
+    collector = MetricsCollector("p", "text")
+    for result, expected, category in records:
+        collector.record(result, expected, category)
+
+    metrics = collector.calculate()
+
+    tp = tn = fp = fn = 0
+    for result, expected, _ in records:
+        positive_expected = expected != SAFE_LABEL
+        positive_actual = result.risk_label != SAFE_LABEL
+        if positive_expected and positive_actual:
+            tp += 1
+        elif not positive_expected and not positive_actual:
+            tn += 1
+        elif positive_actual:
+            fp += 1
+        else:
+            fn += 1
+
+    assert (metrics.true_positive, metrics.true_negative) == (tp, tn)
+    assert (metrics.false_positive, metrics.false_negative) == (fp, fn)
+
+    precision = tp / (tp + fp) * 100
+    recall = tp / (tp + fn) * 100
+    assert metrics.accuracy == pytest.approx((tp + tn) / len(records) * 100)
+    assert metrics.precision == pytest.approx(precision)
+    assert metrics.recall == pytest.approx(recall)
+    assert metrics.f1_score == pytest.approx(2 * precision * recall / (precision + recall))
+
+    times = sorted(r.response_time for r, _, _ in records if r.success)
+    assert metrics.success_count == len(times)
+    assert metrics.fail_count == len(records) - len(times)
+    assert metrics.avg_response_time == pytest.approx(sum(times) / len(times))
+    assert metrics.min_response_time == times[0]
+    assert metrics.max_response_time == times[-1]
+    assert metrics.p50_response_time == nearest_rank(times, 50)
+    assert metrics.p95_response_time == nearest_rank(times, 95)
+    assert metrics.p99_response_time == nearest_rank(times, 99)
+
+    for category in ("黑样本", "白样本"):
+        rows = [(r, e) for r, e, c in records if c == category]
+        match_count = sum(1 for r, e in rows if r.success and labels_match(e, r.risk_label))
+        assert metrics.category_metrics[category] == {
+            "total": len(rows),
+            "success": sum(1 for r, _ in rows if r.success),
+            "match_count": match_count,
+            "match_rate": match_count / len(rows) * 100,
+        }
+
+
+def test_calculate_without_results():
+    metrics = MetricsCollector("p", "text").calculate()
+
+    assert metrics.total_requests == 0
+    assert metrics.accuracy == metrics.precision == metrics.recall == metrics.f1_score == 0
+    assert metrics.p99_response_time == 0
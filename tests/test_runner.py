@@ -0,0 +1,127 @@
+"""Tests for concurrent dispatch and request pacing in the runner."""
+
+import threading
+import time
+
+import pytest
+
+import main
+from src.config import Config
+from src.benchmark.runner import BenchmarkRunner, BenchmarkConfig
+from src.benchmark.utils import RequestPacer
+from src.data.loader import TestCase as Case, ContentType as DataContentType
+from src.providers.base import BaseProvider, ContentType, ModerationResult
+
+
+class SlowProvider(BaseProvider):
+    """Provider whose calls take a fixed time and that tracks calls in flight."""
+    name = "slow"
+    display_name = "Slow"
+
+    def __init__(self, delay: float = 0.05):
+        super().__init__()
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.starts = []
+        self._lock = threading.Lock()
+
+    def _load_config(self):
+        return {}
+
+    def moderate_text(self, text, **kwargs):
+        with self._lock:
+            self.starts.append(time.monotonic())
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return ModerationResult(success=True, response_time=self.delay, content_type=ContentType.TEXT)
+
+    def moderate_image(self, image_url, **kwargs):
+        raise NotImplementedError
+
+
+@pytest.fixture(autouse=True)
+def output_dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "OUTPUT_DIR", tmp_path / "output")
+    monkeypatch.setattr(Config, "REPORT_DIR", tmp_path / "reports")
+
+
+def make_cases(n):
+    return [Case(id=str(i), content=f"text {i}", content_type=DataContentType.TEXT) for i in range(n)]
+
+
+def run(provider, cases, **config):
+    runner = BenchmarkRunner(provider, BenchmarkConfig(**config))
+    return runner.run(text_cases=cases, test_image=False)
+
+
+def test_pacer_spaces_request_starts_across_threads():
+    interval = 0.02
+    pacer = RequestPacer(interval)
+    starts = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(3):
+            pacer.wait()
+            with lock:
+                starts.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    starts.sort()
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert len(starts) == 12
+    # Sleep granularity can only make gaps longer; allow a little jitter
+    assert min(gaps) >= interval * 0.8
+    assert starts[-1] - starts[0] >= interval * 11 * 0.95
+
+
+def test_pacer_disabled_does_not_sleep():
+    pacer = RequestPacer(0)
+    start = time.monotonic()
+    for _ in range(1000):
+        pacer.wait()
+    assert time.monotonic() - start < 0.1
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_runner_keeps_max_workers_requests_in_flight(workers):
+    provider = SlowProvider()
+
+    result = run(provider, make_cases(16), max_workers=workers, request_interval=0)
+
+    assert result.text_metrics.total_requests == 16
+    assert result.text_metrics.success_count == 16
+    assert provider.max_in_flight == workers
+
+
+def test_concurrent_run_is_faster_than_sequential():
+    provider = SlowProvider(delay=0.05)
+    start = time.monotonic()
+
+    run(provider, make_cases(16), max_workers=8, request_interval=0)
+
+    # Sequential dispatch would take 16 * 0.05 = 0.8s
+    assert time.monotonic() - start < 0.4
+
+
+def test_runner_paces_request_starts():
+    provider = SlowProvider(delay=0.0)
+
+    run(provider, make_cases(6), max_workers=4, request_interval=0.03)
+
+    starts = sorted(provider.starts)
+    assert min(b - a for a, b in zip(starts, starts[1:])) >= 0.03 * 0.8
+
+
+def test_concurrency_option_sets_max_workers():
+    assert main.build_benchmark_config(concurrency=3).max_workers == 3
+    assert main.build_benchmark_config().max_workers == Config.MAX_WORKERS
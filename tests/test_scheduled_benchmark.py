@@ -0,0 +1,58 @@
+"""Tests for the scheduled benchmark's rolling statistics."""
+
+import math
+import random
+import statistics
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def scheduled_benchmark(tmp_path_factory):
+    # The module opens scheduled_benchmark.log in the working directory on import
+    cwd = tmp_path_factory.mktemp("scheduled")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(cwd)
+        import scheduled_benchmark
+    return scheduled_benchmark
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_running_stats_matches_statistics(scheduled_benchmark, seed):
+    rng = random.Random(seed)
+    values = [rng.gauss(1000, 250) for _ in range(rng.randint(2, 200))]
+    stats = scheduled_benchmark.RunningStats()
+    for value in values:
+        stats.add(value)
+
+    summary = stats.summary()
+
+    assert stats.count == len(values)
+    assert summary["mean"] == pytest.approx(statistics.fmean(values))
+    assert summary["std"] == pytest.approx(statistics.stdev(values))
+    assert summary["min"] == min(values)
+    assert summary["max"] == max(values)
+
+
+def test_running_stats_with_large_offset(scheduled_benchmark):
+    # Welford's update stays accurate where sum-of-squares would cancel
+    values = [1e9 + x for x in (4, 7, 13, 16)]
+    stats = scheduled_benchmark.RunningStats()
+    for value in values:
+        stats.add(value)
+
+    assert stats.summary()["std"] == pytest.approx(statistics.stdev(values))
+
+
+def test_running_stats_single_value(scheduled_benchmark):
+    stats = scheduled_benchmark.RunningStats()
+    stats.add(42.0)
+
+    assert stats.summary() == {"mean": 42.0, "min": 42.0, "max": 42.0, "std": 0}
+
+
+def test_running_stats_empty(scheduled_benchmark):
+    summary = scheduled_benchmark.RunningStats().summary()
+
+    assert summary["std"] == 0
+    assert math.isinf(summary["min"]) and math.isinf(summary["max"])
@@ -16,6 +16,7 @@ limitations under the License.
 """
 
 import datetime
+import functools
 import hashlib
 import hmac
 from urllib.parse import quote, urlparse
@@ -69,6 +70,17 @@ def hash_sha256(content: bytes):
     return hashlib.sha256(content).hexdigest()
 
 
+# 派生签名密钥只依赖 sk/日期/region/service，同一天内可复用；
+# 返回已用 k_signing 初始化的 HMAC 对象，每次签名时 copy() 后再 update
+@functools.lru_cache(maxsize=32)
+def signing_template(sk: str, short_x_date: str, region: str, service: str):
+    k_date = hmac_sha256(sk.encode("utf-8"), short_x_date)
+    k_region = hmac_sha256(k_date, region)
+    k_service = hmac_sha256(k_region, service)
+    k_signing = hmac_sha256(k_service, "request")
+    return hmac.new(k_signing, digestmod=hashlib.sha256)
+
+
 # 第二步：签名请求函数
 def request_sign(header, ak, sk, region, url, path, action, body):
     host = urlparse(url).netloc
@@ -139,11 +151,11 @@ def request_sign(header, ak, sk, region, url, path, action, body):
 
     # 打印最终计算的签名字符串用于调试比对
     # print(string_to_sign)
-    k_date = hmac_sha256(credential["secret_access_key"].encode("utf-8"), short_x_date)
-    k_region = hmac_sha256(k_date, credential["region"])
-    k_service = hmac_sha256(k_region, credential["service"])
-    k_signing = hmac_sha256(k_service, "request")
-    signature = hmac_sha256(k_signing, string_to_sign).hex()
+    signer = signing_template(
+        credential["secret_access_key"], short_x_date, credential["region"], credential["service"]
+    ).copy()
+    signer.update(string_to_sign.encode("utf-8"))
+    signature = signer.hexdigest()
 
     sign_result["Authorization"] = "HMAC-SHA256 Credential={}, SignedHeaders={}, Signature={}".format(
         credential["access_key_id"] + "/" + credential_scope,